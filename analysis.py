@@ -4,11 +4,59 @@ import pandas as pd
 import numpy as np
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
 from matplotlib.figure import Figure
-from scipy import stats, signal
-import seaborn as sns
+from matplotlib.collections import LineCollection
+from dataclasses import dataclass
+from functools import partial
+import csv
+import threading
 import types
 import os
-import matplotlib.pyplot as plt
+
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional – the NumPy fallbacks below keep everything working
+    njit = None
+
+if njit is not None:
+    @njit(cache=True, boundscheck=False)
+    def _first_crossing_ge(arr, lo, hi, thr):
+        """First index in [lo, hi] where arr[i] >= thr, or -1."""
+        for i in range(lo, hi + 1):
+            if arr[i] >= thr:
+                return i
+        return -1
+
+    @njit(cache=True, boundscheck=False)
+    def _first_crossing_le(arr, lo, hi, thr):
+        """First index in [lo, hi] where arr[i] <= thr, or -1."""
+        for i in range(lo, hi + 1):
+            if arr[i] <= thr:
+                return i
+        return -1
+else:
+    def _first_crossing_ge(arr, lo, hi, thr):
+        seg = arr[lo:hi + 1]
+        if seg.size == 0:
+            return -1  # empty range, same as the njit loop not running
+        offset = int(np.argmax(seg >= thr))
+        return lo + offset if seg[offset] >= thr else -1
+
+    def _first_crossing_le(arr, lo, hi, thr):
+        seg = arr[lo:hi + 1]
+        if seg.size == 0:
+            return -1
+        offset = int(np.argmax(seg <= thr))
+        return lo + offset if seg[offset] <= thr else -1
+
+
+@dataclass(slots=True)
+class _RowMeta:
+    """Per-row link between a Treeview item and its peak."""
+    dataset: str
+    reading_key: str
+    peak_idx: int
+
 
 class CaMKIIAnalyzer:
     def __init__(self, root):
@@ -23,7 +71,16 @@ class CaMKIIAnalyzer:
 
         self.rhod_normalized = {}
         self.fret_normalized = {}
-        
+
+        # ndarray companions so hot paths skip repeated pandas conversions
+        self._time_arr = None
+        self._rhod_arr = {}
+        self._fret_arr = {}
+        self._rhod_reading_cols = {}
+        self._fret_reading_cols = {}
+        self._pts_per_min = None
+        self._time_str = None
+
         # data structure for automatically found peaks
         self.rhod_peaks = {}
         self.fret_peaks = {}
@@ -37,14 +94,43 @@ class CaMKIIAnalyzer:
         # manual overrides for match ids in tables
         self.manual_match_overrides = {'Rhod': {}, 'FRET': {}}
 
+        # cached axis backgrounds for blitting the hover highlight
+        self._bg_cache = {}
+
+        # pending coalesced canvas redraw (at most one per ~16ms)
+        self._pending_draw = None
+
+        # pending debounced update_plot for rapid boundary edits
+        self._replot_after_id = None
+
+        # persistent plot artists reused across update_plot calls
+        self._plot_artists = None
+        self._detect_in_progress = False
+        self._peaks_version = 0
+        self._last_plot_key = None
+        self._legend_sig = None
+
+        # per-reading boundary segment arrays, rebuilt only after peak edits
+        self._boundary_segs = {'Rhod': {}, 'FRET': {}}
+
+        # last (reading_key, peaks_version) -> (metrics, metrics, pairs)
+        self._edit_cache = None
+
+        # (dataset, reading_key) -> overall baseline percentile of the
+        # normalized trace; only normalization changes it
+        self._baseline_cache = {}
+
         # link structures for hover interactions
         self._table_item_lookup = {'Rhod': {}, 'FRET': {}}
+        self._table_signature = {'Rhod': None, 'FRET': None}
+        self._match_index = {'Rhod': {}, 'FRET': {}}
         self._hovered_peak = {'Rhod': None, 'FRET': None}
         self._table_edit_entry = None
         self._table_edit_meta = None
 
         self.fret_color = 'black'
         self.rhod_color = 'red'
+        self._boundary_color = '#4c72b0'
         self.plot_title = 'CaMKII and Calcium Analysis'
 
         # analysis parameters
@@ -56,6 +142,9 @@ class CaMKIIAnalyzer:
         self.overlay_var = tk.BooleanVar(value=False)
 
         self.boundary_diagnostics_enabled = True
+        # CSV candidates are cheap; the per-reading PNG render is not, so
+        # figures are opt-in (the CLI turns them back on)
+        self._boundary_diag_figures_enabled = False
         self._boundary_diag_dir = os.path.join(os.getcwd(), 'boundary_diagnostics')
 
         self.detection_vars = {
@@ -74,7 +163,23 @@ class CaMKIIAnalyzer:
         }
 
         self.setup_ui()
-    
+
+    def _make_button(self, text, command):
+        """Uniformly styled control-bar button, already packed."""
+        button = tk.Button(
+            self.control_frame,
+            text=text,
+            command=command,
+            height=1,
+            padx=6,
+            pady=2,
+            bd=1,
+            relief=tk.RAISED,
+            highlightthickness=0
+        )
+        button.pack(side=tk.LEFT, padx=5)
+        return button
+
     def setup_ui(self):
         # create main frames
         self.control_frame = ttk.Frame(self.root, padding="5")
@@ -87,29 +192,10 @@ class CaMKIIAnalyzer:
         self.plot_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
         # add controls to load data
-        tk.Button(
-            self.control_frame,
-            text="Load Rhod Data",
-            command=self.load_rhod_data,
-            height=1,
-            padx=6,
-            pady=2,
-            bd=1,
-            relief=tk.RAISED,
-            highlightthickness=0
-        ).pack(side=tk.LEFT, padx=5)
-        tk.Button(
-            self.control_frame,
-            text="Load FRET Data",
-            command=self.load_fret_data,
-            height=1,
-            padx=6,
-            pady=2,
-            bd=1,
-            relief=tk.RAISED,
-            highlightthickness=0
-        ).pack(side=tk.LEFT, padx=5)
-        
+        self._make_button("Load Rhod Data", self.load_rhod_data)
+        self._make_button("Load FRET Data", self.load_fret_data)
+
+
         # trial/reading selector
         ttk.Label(self.control_frame, text="Reading:").pack(side=tk.LEFT, padx=5)
         self.reading_var = tk.StringVar(value="1")
@@ -117,100 +203,33 @@ class CaMKIIAnalyzer:
             self.control_frame, 
             from_=1, to=20,
             textvariable=self.reading_var,
-            command=self.update_plot,
+            command=self._request_replot,
             width=5
         )
         self.reading_selector.pack(side=tk.LEFT, padx=5)
         
-        # save plot 
-        tk.Button(
-            self.control_frame,
-            text="Save Plot",
-            command=self.save_plot,
-            height=1,
-            padx=6,
-            pady=2,
-            bd=1,
-            relief=tk.RAISED,
-            highlightthickness=0
-        ).pack(side=tk.LEFT, padx=5)
-        
-        # analysis button (amplitude, max width, rate of growth/decay, etc)
-        tk.Button(
-            self.control_frame,
-            text="Analyze Data",
-            command=self.analyze_data,
-            height=1,
-            padx=6,
-            pady=2,
-            bd=1,
-            relief=tk.RAISED,
-            highlightthickness=0
-        ).pack(side=tk.LEFT, padx=5)
-
-        # automatic peak detection button
-        tk.Button(
-            self.control_frame,
-            text="Detect Peaks",
-            command=self.detect_peaks,
-            height=1,
-            padx=6,
-            pady=2,
-            bd=1,
-            relief=tk.RAISED,
-            highlightthickness=0
-        ).pack(side=tk.LEFT, padx=5)
-
-        # reset zoom
-        tk.Button(
-            self.control_frame,
-            text="Reset View",
-            command=self.reset_view,
-            height=1,
-            padx=6,
-            pady=2,
-            bd=1,
-            relief=tk.RAISED,
-            highlightthickness=0
-        ).pack(side=tk.LEFT, padx=5)
+        # remaining control-bar buttons, in packing order
+        self._make_button("Save Plot", self.save_plot)
+        self._make_button("Analyze Data", self.analyze_data)
+        self._make_button("Detect Peaks", self.detect_peaks)
+        self._make_button("Detect All", self.detect_all_readings)
+        self._make_button("Reset View", self.reset_view)
 
         # button for manual table editing view (toggles panel to right)
         self.edit_mode = False
-        self.edit_button = tk.Button(
-            self.control_frame,
-            text="Edit Peaks",
-            command=self.toggle_edit_mode,
-            height=1,
-            padx=6,
-            pady=2,
-            bd=1,
-            relief=tk.RAISED,
-            highlightthickness=0
-        )
-        self.edit_button.pack(side=tk.LEFT, padx=5)
+        self.edit_button = self._make_button("Edit Peaks", self.toggle_edit_mode)
 
-        # clear peaks button
-        tk.Button(
-            self.control_frame,
-            text="Clear Peaks",
-            command=self.clear_peaks,
-            height=1,
-            padx=6,
-            pady=2,
-            bd=1,
-            relief=tk.RAISED,
-            highlightthickness=0
-        ).pack(side=tk.LEFT, padx=5)
+        self._make_button("Clear Peaks", self.clear_peaks)
 
         # toggle peak boundary visibility
         self.show_boundaries_var = tk.BooleanVar(value=True)
-        ttk.Checkbutton(self.control_frame, text="Show Peak Boundaries", 
+        ttk.Checkbutton(self.control_frame, text="Show Peak Boundaries",
                       variable=self.show_boundaries_var,
-                      command=self.update_plot).pack(side=tk.LEFT, padx=5)
+                      command=self._request_replot).pack(side=tk.LEFT, padx=5)
 
         ttk.Checkbutton(self.control_frame, text="Merge Plots",
                       variable=self.overlay_var,
-                      command=self.update_plot).pack(side=tk.LEFT, padx=5)
+                      command=self._request_replot).pack(side=tk.LEFT, padx=5)
         
         # initialize matplotlib figure
         # embed a dedicated Figure object so tkinter does not fight pyplot state
@@ -237,6 +256,8 @@ class CaMKIIAnalyzer:
         self.canvas.mpl_connect('button_press_event', self.on_click)
         self.canvas.mpl_connect('motion_notify_event', self.on_plot_motion)
         self.canvas.mpl_connect('axes_leave_event', self.on_axes_leave)
+        self.canvas.mpl_connect('draw_event', self._invalidate_blit_cache)
+        self.canvas.mpl_connect('resize_event', self._invalidate_blit_cache)
         self.root.bind('<Escape>', lambda event: self._clear_navigation_mode(update_status=True))
 
         # add status bar for user guidance
@@ -385,14 +406,16 @@ class CaMKIIAnalyzer:
         fret_scroll.pack(side=tk.RIGHT, fill=tk.Y)
 
         for tree, dataset in ((self.rhod_tree, 'Rhod'), (self.fret_tree, 'FRET')):
-            tree.bind('<Motion>', lambda event, t=tree, d=dataset: self._on_table_motion(event, t, d))
-            tree.bind('<Leave>', lambda event, t=tree, d=dataset: self._on_table_leave(t, d))
-            tree.bind('<Button-1>', lambda event, t=tree, d=dataset: self._on_table_click(event, t, d))
-            tree.bind('<Double-1>', lambda event, t=tree, d=dataset: self._start_table_edit(event, t, d))
+            tree.bind('<Motion>', partial(self._on_table_motion, tree=tree, dataset=dataset))
+            tree.bind('<Leave>', partial(self._on_table_leave, tree=tree, dataset=dataset))
+            tree.bind('<Button-1>', partial(self._on_table_click, tree=tree, dataset=dataset))
+            tree.bind('<Double-1>', partial(self._start_table_edit, tree=tree, dataset=dataset))
 
         self._table_row_meta = {'Rhod': {}, 'FRET': {}}
+        self._table_columns = {'Rhod': self.rhod_tree['columns'], 'FRET': self.fret_tree['columns']}
         self._current_table_hover = {'Rhod': None, 'FRET': None}
         self._action_hover_row = {'Rhod': None, 'FRET': None}
+        self._last_motion = {'Rhod': None, 'FRET': None}
         self._hover_tag = 'hover'
         self.rhod_tree.tag_configure(self._hover_tag, background='#e3e6eb', foreground='#222222')
         self.fret_tree.tag_configure(self._hover_tag, background='#e3e6eb', foreground='#222222')
@@ -403,8 +426,14 @@ class CaMKIIAnalyzer:
         for tree in (self.rhod_tree, self.fret_tree):
             tree.tag_configure(self._action_hover_tag, foreground='#b00020')
 
+        # precomputed tag tuples so the hover hot path never rebuilds sets
+        self._hover_only_tags = (self._hover_tag,)
+        self._hover_action_tags = (self._hover_tag, self._action_hover_tag)
+
         self._peak_highlight_artists = {'Rhod': None, 'FRET': None}
         self._table_item_lookup = {'Rhod': {}, 'FRET': {}}
+        self._table_signature = {'Rhod': None, 'FRET': None}
+        self._match_index = {'Rhod': {}, 'FRET': {}}
         self._hovered_peak = {'Rhod': None, 'FRET': None}
 
     def _build_detection_controls(self):
@@ -473,16 +502,9 @@ class CaMKIIAnalyzer:
         reading = int(self.reading_var.get())
         reading_key = f'#{reading}'
 
-        rhod_series = self.rhod_normalized.get(reading_key)
-        rhod_props = self.rhod_peak_properties.get(reading_key)
-        fret_series = self.fret_normalized.get(reading_key)
-        fret_props = self.fret_peak_properties.get(reading_key)
-
-        rhod_metrics = self._collect_peak_metrics(rhod_series, rhod_props or []) if rhod_series is not None else []
-        fret_metrics = self._collect_peak_metrics(fret_series, fret_props or []) if fret_series is not None else []
+        rhod_metrics, fret_metrics, matched_pairs = self._reading_metrics(reading_key)
 
         match_map = {'Rhod': {}, 'FRET': {}}
-        matched_pairs = self._match_peak_pairs(rhod_metrics, fret_metrics)
         for idx, pair in enumerate(matched_pairs, start=1):
             match_map['Rhod'][pair['rhod']['peak_idx']] = idx
             match_map['FRET'][pair['fret']['peak_idx']] = idx
@@ -493,29 +515,49 @@ class CaMKIIAnalyzer:
         self._populate_table('Rhod', rhod_metrics, rhod_matches, reading_key)
         self._populate_table('FRET', fret_metrics, fret_matches, reading_key)
 
+    def _reading_metrics(self, reading_key):
+        """Metrics and auto-matching for one reading, cached until peaks change.
+
+        Shared by the edit tables and the analysis window so reopening either
+        view without editing peaks costs two dict lookups, not a recompute.
+        """
+        cache_key = (reading_key, self._peaks_version)
+        if self._edit_cache is not None and self._edit_cache[0] == cache_key:
+            return self._edit_cache[1]
+
+        rhod_series = self.rhod_normalized.get(reading_key)
+        rhod_props = self.rhod_peak_properties.get(reading_key)
+        fret_series = self.fret_normalized.get(reading_key)
+        fret_props = self.fret_peak_properties.get(reading_key)
+
+        rhod_metrics = self._collect_peak_metrics(rhod_series, rhod_props or []) if rhod_series is not None else []
+        fret_metrics = self._collect_peak_metrics(fret_series, fret_props or []) if fret_series is not None else []
+        matched_pairs = self._match_peak_pairs(rhod_metrics, fret_metrics)
+        self._edit_cache = (cache_key, (rhod_metrics, fret_metrics, matched_pairs))
+        return self._edit_cache[1]
+
     def _resolve_match_map(self, dataset, reading_key, metrics, auto_map):
         manual_all = self.manual_match_overrides.setdefault(dataset, {})
-        manual_for_reading = manual_all.get(reading_key, {})
-
-        valid_indices = {metric['peak_idx'] for metric in metrics}
-        cleaned_manual = {idx: manual_for_reading[idx] for idx in manual_for_reading if idx in valid_indices}
+        manual_for_reading = manual_all.get(reading_key)
 
-        if cleaned_manual:
-            manual_all[reading_key] = cleaned_manual
-        else:
-            manual_all.pop(reading_key, None)
+        valid = dict.fromkeys(metric['peak_idx'] for metric in metrics)
 
-        resolved = {}
-        for metric in metrics:
-            peak_idx = metric['peak_idx']
-            if peak_idx in cleaned_manual:
-                resolved[peak_idx] = cleaned_manual[peak_idx]
-            elif peak_idx in auto_map:
-                resolved[peak_idx] = auto_map[peak_idx]
+        # only copy the override dict when it actually holds stale peaks
+        if manual_for_reading and any(idx not in valid for idx in manual_for_reading):
+            manual_for_reading = {idx: value for idx, value in manual_for_reading.items()
+                                  if idx in valid}
+            if manual_for_reading:
+                manual_all[reading_key] = manual_for_reading
             else:
-                resolved[peak_idx] = ''
+                manual_all.pop(reading_key, None)
 
-        return resolved
+        get_auto = auto_map.get
+        if not manual_for_reading:
+            return {peak_idx: get_auto(peak_idx, '') for peak_idx in valid}
+
+        get_manual = manual_for_reading.get
+        return {peak_idx: get_manual(peak_idx, get_auto(peak_idx, ''))
+                for peak_idx in valid}
 
     def _clear_manual_match_override(self, dataset, reading_key, peak_idx):
         manual_dataset = self.manual_match_overrides.get(dataset)
@@ -536,50 +578,115 @@ class CaMKIIAnalyzer:
 
     def _populate_table(self, dataset, metrics, match_map=None, reading_key=None):
         tree = self._table_widgets[dataset]
-        tree.delete(*tree.get_children())
-        self._table_row_meta[dataset].clear()
+        row_meta = self._table_row_meta[dataset]
+        lookup = self._table_item_lookup[dataset]
+
+        # skip the whole refresh (including highlight churn) when the rows
+        # we would render are identical to what the table already shows
+        signature = (
+            reading_key,
+            tuple(metric['peak_idx'] for metric in metrics) if metrics else None,
+            tuple(sorted(match_map.items())) if match_map else None,
+        )
+        if signature == self._table_signature.get(dataset):
+            return
+        self._table_signature[dataset] = signature
+
         self._current_table_hover[dataset] = None
+        self._last_motion[dataset] = None
         self._clear_peak_highlight(dataset, suppress_draw=True)
         self._clear_action_hover(dataset)
-        self._table_item_lookup[dataset].clear()
 
         if not metrics:
+            tree.delete(*tree.get_children())
+            row_meta.clear()
+            lookup.clear()
+            self._match_index[dataset] = {}
             tree.insert('', tk.END, values=('', '', 'No peaks detected', ''), tags=('placeholder',))
             return
 
+        # drop any placeholder left over from an empty state
+        for item in tree.get_children(''):
+            if 'placeholder' in tree.item(item, 'tags'):
+                tree.delete(item)
+                row_meta.pop(item, None)
+
         match_map = match_map or {}
         action_symbol = '✖'
 
-        for metric in metrics:
+        # delete only rows whose peak disappeared, update/insert the rest in place
+        new_indices = {metric['peak_idx'] for metric in metrics}
+        for peak_idx in list(lookup):
+            if peak_idx not in new_indices:
+                item = lookup.pop(peak_idx)
+                row_meta.pop(item, None)
+                if tree.exists(item):
+                    tree.delete(item)
+
+        times_str = self._time_strings()
+        if times_str is None:
+            times_str = np.char.mod('%.2f', np.zeros(1 + max(new_indices)))
+
+        # pre-bind the Tk methods used per row; each call is a Tcl round-trip
+        tree_exists = tree.exists
+        tree_item = tree.item
+        tree_move = tree.move
+        tree_insert = tree.insert
+
+        match_index = {}
+        for position, metric in enumerate(metrics):
             peak_idx = metric['peak_idx']
             match_id = match_map.get(peak_idx, '')
-            time_value = float(self.time_data.iloc[peak_idx]) if self.time_data is not None else 0.0
 
             values = (
                 str(match_id) if match_id else '',
                 metric.get('ordinal', ''),
-                f"{time_value:.2f}",
+                times_str[peak_idx],
                 action_symbol
             )
-            item = tree.insert('', tk.END, values=values)
-            self._table_row_meta[dataset][item] = {
-                'reading_key': reading_key,
-                'peak_idx': peak_idx,
-                'dataset': dataset
-            }
-            self._table_item_lookup[dataset][peak_idx] = item
+            item = lookup.get(peak_idx)
+            if item is not None and tree_exists(item):
+                tree_item(item, values=values, tags=())
+                tree_move(item, '', position)
+            else:
+                item = tree_insert('', position, values=values)
+                lookup[peak_idx] = item
+            row_meta[item] = _RowMeta(dataset, reading_key, peak_idx)
+            if match_id:
+                match_index[str(match_id)] = item
+        self._match_index[dataset] = match_index
+
+    def _update_table_row(self, dataset, peak_idx, **column_updates):
+        """O(1) update of one row's columns; False means caller must do a full refresh."""
+        tree = self._table_widgets.get(dataset)
+        item = self._table_item_lookup.get(dataset, {}).get(peak_idx)
+        if tree is None or not item or not tree.exists(item):
+            return False
+        for column, value in column_updates.items():
+            tree.set(item, column, value)
+        # the rendered rows no longer match the last full-populate signature
+        self._table_signature[dataset] = None
+        return True
 
     def _on_table_motion(self, event, tree, dataset):
         row_id = tree.identify_row(event.y)
         column_id = tree.identify_column(event.x)
-        columns = tree['columns']
+        columns = self._table_columns[dataset]
         col_key = None
         if column_id and column_id.startswith('#'):
             index = int(column_id.replace('#', '')) - 1
             if 0 <= index < len(columns):
                 col_key = columns[index]
 
-        if not row_id or 'placeholder' in tree.item(row_id, 'tags'):
+        # motion events arrive at mouse-poll rate; skip the Tcl traffic
+        # below when the hovered cell has not changed
+        if (row_id, col_key) == self._last_motion[dataset]:
+            return
+        self._last_motion[dataset] = (row_id, col_key)
+
+        # placeholder rows never get row metadata, so this doubles as the
+        # placeholder check without a tree.item round-trip
+        if not row_id or row_id not in self._table_row_meta[dataset]:
             self._clear_table_highlight(dataset)
             self._clear_action_hover(dataset)
             tree.configure(cursor='')
@@ -594,8 +701,9 @@ class CaMKIIAnalyzer:
             tree.configure(cursor='')
             self._clear_action_hover(dataset)
 
-    def _on_table_leave(self, tree, dataset):
+    def _on_table_leave(self, event, tree, dataset):
         tree.configure(cursor='')
+        self._last_motion[dataset] = None
         self._clear_table_highlight(dataset)
         self._clear_action_hover(dataset)
 
@@ -605,27 +713,21 @@ class CaMKIIAnalyzer:
 
         self._clear_table_highlight(dataset, suppress_plot=True)
 
-        existing_tags = set(tree.item(item_id, 'tags'))
-        existing_tags.add(self._hover_tag)
-        tree.item(item_id, tags=tuple(existing_tags))
+        tree.item(item_id, tags=self._hover_only_tags)
         self._current_table_hover[dataset] = item_id
 
         meta = self._table_row_meta[dataset].get(item_id)
         if meta is not None:
-            self._hovered_peak[dataset] = meta['peak_idx']
-            self._highlight_peak_on_plot(dataset, meta['reading_key'], meta['peak_idx'])
+            self._hovered_peak[dataset] = meta.peak_idx
+            self._highlight_peak_on_plot(dataset, meta.reading_key, meta.peak_idx)
 
     def _clear_table_highlight(self, dataset, suppress_plot=False):
         item_id = self._current_table_hover.get(dataset)
         if item_id:
             tree = self._table_widgets[dataset]
-            try:
-                tags = set(tree.item(item_id, 'tags'))
-                if self._hover_tag in tags:
-                    tags.discard(self._hover_tag)
-                    tree.item(item_id, tags=tuple(tags))
-            except tk.TclError:
-                pass
+            if tree.exists(item_id):
+                remaining = (self._action_hover_tag,) if self._action_hover_row.get(dataset) == item_id else ()
+                tree.item(item_id, tags=remaining)
         self._current_table_hover[dataset] = None
         self._hovered_peak[dataset] = None
         if not suppress_plot:
@@ -635,22 +737,19 @@ class CaMKIIAnalyzer:
         if self._action_hover_row[dataset] == item_id:
             return
         self._clear_action_hover(dataset)
-        tags = set(tree.item(item_id, 'tags'))
-        tags.add(self._action_hover_tag)
-        tree.item(item_id, tags=tuple(tags))
+        if self._current_table_hover.get(dataset) == item_id:
+            tree.item(item_id, tags=self._hover_action_tags)
+        else:
+            tree.item(item_id, tags=(self._action_hover_tag,))
         self._action_hover_row[dataset] = item_id
 
     def _clear_action_hover(self, dataset):
         current = self._action_hover_row.get(dataset)
         if current:
             tree = self._table_widgets[dataset]
-            try:
-                tags = set(tree.item(current, 'tags'))
-                if self._action_hover_tag in tags:
-                    tags.discard(self._action_hover_tag)
-                    tree.item(current, tags=tuple(tags))
-            except tk.TclError:
-                pass
+            if tree.exists(current):
+                remaining = self._hover_only_tags if self._current_table_hover.get(dataset) == current else ()
+                tree.item(current, tags=remaining)
         self._action_hover_row[dataset] = None
 
     def _on_table_click(self, event, tree, dataset):
@@ -665,7 +764,7 @@ class CaMKIIAnalyzer:
             if 0 <= index < len(columns) and columns[index] == 'action':
                 meta = self._table_row_meta[dataset].get(row_id)
                 if meta is not None:
-                    self._delete_peak(dataset, meta['reading_key'], meta['peak_idx'])
+                    self._delete_peak(dataset, meta.reading_key, meta.peak_idx)
                     self._clear_table_highlight(dataset)
                     return 'break'
 
@@ -710,8 +809,8 @@ class CaMKIIAnalyzer:
         self._table_edit_entry = entry
         self._table_edit_meta = {
             'dataset': dataset,
-            'reading_key': meta['reading_key'],
-            'peak_idx': meta['peak_idx'],
+            'reading_key': meta.reading_key,
+            'peak_idx': meta.peak_idx,
             'row_id': row_id,
             'column': column_key
         }
@@ -769,9 +868,8 @@ class CaMKIIAnalyzer:
             self._cancel_table_edit()
             return
 
-        time_array = self.time_data.values
-        nearest_idx = int(np.argmin(np.abs(time_array - requested_time)))
-        snapped_time = float(self.time_data.iloc[nearest_idx])
+        nearest_idx = self._nearest_time_index(requested_time)
+        snapped_time = float(self._time_values()[nearest_idx])
 
         peaks_dict = self.rhod_peaks if dataset == 'Rhod' else self.fret_peaks
 
@@ -784,8 +882,9 @@ class CaMKIIAnalyzer:
             self._cancel_table_edit()
             return
 
-        indices = np.where(peaks == old_idx)[0]
-        if indices.size == 0:
+        # peaks stay sorted, so the slot and duplicate checks are binary searches
+        slot = int(np.searchsorted(peaks, old_idx))
+        if slot >= len(peaks) or peaks[slot] != old_idx:
             self._cancel_table_edit()
             return
 
@@ -794,7 +893,8 @@ class CaMKIIAnalyzer:
             self.status_bar.config(text=f"No change: {dataset} peak already at {snapped_time:.2f} min")
             return
 
-        if nearest_idx in peaks and nearest_idx != old_idx:
+        dup = int(np.searchsorted(peaks, nearest_idx))
+        if dup < len(peaks) and peaks[dup] == nearest_idx:
             messagebox.showwarning(
                 "Duplicate Peak",
                 f"A {dataset} peak already exists at {snapped_time:.2f} min."
@@ -803,11 +903,10 @@ class CaMKIIAnalyzer:
             entry.select_range(0, tk.END)
             return
 
-        new_peaks = peaks.copy()
-        new_peaks[indices[0]] = nearest_idx
-        order = np.argsort(new_peaks)
-        new_peaks = new_peaks[order].astype(int)
-        peaks_dict[reading_key] = new_peaks
+        # move = delete old slot + sorted insert of the new index
+        new_peaks = np.delete(peaks, slot)
+        insert_at = int(np.searchsorted(new_peaks, nearest_idx))
+        peaks_dict[reading_key] = np.insert(new_peaks, insert_at, nearest_idx).astype(int)
 
         self._rebuild_peak_properties(dataset, reading_key)
 
@@ -835,16 +934,21 @@ class CaMKIIAnalyzer:
         reading_key = meta['reading_key']
         peak_idx = meta['peak_idx']
 
-        manual_dataset = self.manual_match_overrides.setdefault(dataset, {})
-        overrides = manual_dataset.get(reading_key)
+        # don't create dataset/reading entries just to look at them; the
+        # set path below creates them on demand
+        manual_dataset = self.manual_match_overrides.get(dataset)
+        overrides = manual_dataset.get(reading_key) if manual_dataset else None
 
         if not value:
             cleared = False
-            if overrides and peak_idx in overrides:
-                overrides.pop(peak_idx, None)
-                cleared = True
-                if not overrides:
-                    manual_dataset.pop(reading_key, None)
+            if overrides:
+                try:
+                    del overrides[peak_idx]
+                    cleared = True
+                except KeyError:
+                    pass
+                if cleared and not overrides:
+                    del manual_dataset[reading_key]
 
             self._cancel_table_edit()
 
@@ -855,7 +959,7 @@ class CaMKIIAnalyzer:
             if cleared:
                 time_text = ''
                 if self.time_data is not None and 0 <= peak_idx < len(self.time_data):
-                    time_text = f" at {float(self.time_data.iloc[peak_idx]):.2f} min"
+                    time_text = f" at {float(self._time_values()[peak_idx]):.2f} min"
                 self.status_bar.config(text=f"Cleared {dataset} match override{time_text}")
             return
 
@@ -873,38 +977,40 @@ class CaMKIIAnalyzer:
             entry.select_range(0, tk.END)
             return
 
-        tree = self._table_widgets.get(dataset)
-        if tree is not None:
-            for item in tree.get_children(''):
-                if item == meta.get('row_id'):
-                    continue
-                if 'placeholder' in tree.item(item, 'tags'):
-                    continue
-                existing = tree.set(item, 'match').strip()
-                if existing and existing == str(match_id):
-                    entry.delete(0, tk.END)
-                    messagebox.showwarning(
-                        "Duplicate Match",
-                        f"Match {match_id} is already assigned to another {dataset} peak."
-                    )
-                    entry.focus_set()
-                    return
+        existing_row = self._match_index.get(dataset, {}).get(str(match_id))
+        if existing_row and existing_row != meta.get('row_id'):
+            entry.delete(0, tk.END)
+            messagebox.showwarning(
+                "Duplicate Match",
+                f"Match {match_id} is already assigned to another {dataset} peak."
+            )
+            entry.focus_set()
+            return
 
         if overrides is None:
-            overrides = {}
-            manual_dataset[reading_key] = overrides
+            if manual_dataset is None:
+                manual_dataset = self.manual_match_overrides.setdefault(dataset, {})
+            overrides = manual_dataset.setdefault(reading_key, {})
 
         overrides[peak_idx] = match_id
 
         self._cancel_table_edit()
 
         if getattr(self, 'edit_mode', False):
-            self._refresh_edit_tables()
+            # the peak set is unchanged, so patch the one affected cell
+            if self._update_table_row(dataset, peak_idx, match=str(match_id)):
+                row = self._table_item_lookup.get(dataset, {}).get(peak_idx)
+                index = self._match_index.setdefault(dataset, {})
+                for key in [k for k, v in index.items() if v == row]:
+                    del index[key]
+                index[str(match_id)] = row
+            else:
+                self._refresh_edit_tables()
             self._highlight_table_from_plot(dataset, peak_idx)
 
         time_text = ''
         if self.time_data is not None and 0 <= peak_idx < len(self.time_data):
-            time_text = f" at {float(self.time_data.iloc[peak_idx]):.2f} min"
+            time_text = f" at {float(self._time_values()[peak_idx]):.2f} min"
 
         self.status_bar.config(text=f"Set {dataset} match to {match_id}{time_text}")
 
@@ -920,33 +1026,86 @@ class CaMKIIAnalyzer:
         if peak_idx >= len(series):
             return
 
-        time_value = float(self.time_data.iloc[peak_idx])
-        amplitude = float(series.iloc[peak_idx])
+        arr_dict = self._fret_arr if dataset == 'FRET' else self._rhod_arr
+        series_arr = arr_dict.get(reading_key)
+        time_value = float(self._time_values()[peak_idx])
+        amplitude = float(series_arr[peak_idx]) if series_arr is not None else float(series.iloc[peak_idx])
 
         axis = self.ax1 if dataset == 'FRET' else (self.ax_overlay if self.overlay_var.get() else self.ax2)
 
-        self._clear_peak_highlight(dataset, suppress_draw=True)
-        highlight = axis.scatter(
-            [time_value], [amplitude],
-            s=100,
-            facecolors='none',
-            edgecolors='#d62728',
-            linewidths=2,
-            zorder=10
-        )
-        self._peak_highlight_artists[dataset] = highlight
+        # reuse the marker artist across hovers; recreate only when the
+        # target axis changed or a full replot wiped it
+        highlight = self._peak_highlight_artists.get(dataset)
+        if highlight is not None and highlight.axes is axis:
+            highlight.set_offsets([[time_value, amplitude]])
+            highlight.set_visible(True)
+        else:
+            if highlight is not None:
+                try:
+                    highlight.remove()
+                except Exception:
+                    pass
+            highlight = axis.scatter(
+                [time_value], [amplitude],
+                s=100,
+                facecolors='none',
+                edgecolors='#d62728',
+                linewidths=2,
+                zorder=10
+            )
+            self._peak_highlight_artists[dataset] = highlight
+        self._blit_highlight(axis, highlight)
+
+    def _schedule_draw(self):
+        """Coalesce rapid redraw requests into at most one per ~16ms."""
+        if self._pending_draw is None:
+            self._pending_draw = self.root.after(16, self._do_scheduled_draw)
+
+    def _do_scheduled_draw(self):
+        self._pending_draw = None
         self.canvas.draw_idle()
 
+    def _invalidate_blit_cache(self, event=None):
+        if getattr(self, '_bg_cache', None):
+            self._bg_cache.clear()
+
+    def _blit_highlight(self, axis, artist):
+        """Redraw only the highlight artist over a cached axis background."""
+        bg = self._bg_cache.get(axis)
+        if bg is None:
+            try:
+                # paint everything but the highlight once, then snapshot it
+                artist.set_visible(False)
+                self.canvas.draw()
+                bg = self.canvas.copy_from_bbox(axis.bbox)
+                self._bg_cache[axis] = bg
+                artist.set_visible(True)
+            except Exception:
+                artist.set_visible(True)
+                self._schedule_draw()
+                return
+        self.canvas.restore_region(bg)
+        axis.draw_artist(artist)
+        self.canvas.blit(axis.bbox)
+
     def _clear_peak_highlight(self, dataset, suppress_draw=False):
         artist = self._peak_highlight_artists.get(dataset)
         if artist is not None:
-            try:
-                artist.remove()
-            except Exception:
-                pass
-            self._peak_highlight_artists[dataset] = None
+            axis = artist.axes
+            if axis is None:
+                # a full replot already destroyed the artist
+                self._peak_highlight_artists[dataset] = None
+                return
+            if not artist.get_visible():
+                return
+            artist.set_visible(False)
             if not suppress_draw:
-                self.canvas.draw_idle()
+                bg = self._bg_cache.get(axis)
+                if bg is not None:
+                    self.canvas.restore_region(bg)
+                    self.canvas.blit(axis.bbox)
+                else:
+                    self._schedule_draw()
 
     # moving cursor across detected peak while edit mode is on highlights marker and row in table
     def _highlight_table_from_plot(self, dataset, peak_idx):
@@ -965,15 +1124,14 @@ class CaMKIIAnalyzer:
             self._clear_table_highlight(dataset, suppress_plot=True)
             return
 
-        tree.see(item)
+        # an unchanged hover row is already visible and tagged – no Tcl calls
         current = self._current_table_hover.get(dataset)
         if current == item:
             return
 
         self._clear_table_highlight(dataset, suppress_plot=True)
-        tags = set(tree.item(item, 'tags'))
-        tags.add(self._hover_tag)
-        tree.item(item, tags=tuple(tags))
+        tree.see(item)
+        tree.item(item, tags=self._hover_only_tags)
         self._current_table_hover[dataset] = item
 
     def _clear_hover_state(self, dataset=None):
@@ -1019,19 +1177,21 @@ class CaMKIIAnalyzer:
             return
 
         peaks = peaks_dict[reading_key]
-        peak_times = self.time_data.iloc[peaks].values
-        diffs = np.abs(peak_times - event.xdata)
-
-        if len(diffs) == 0:
-            self._clear_hover_state(dataset)
-            return
+        peak_times = self._time_values()[peaks]
+        x = float(event.xdata)
 
         xmin, xmax = axis.get_xlim()
         view_span = max(abs(xmax - xmin), 1e-6)
         tolerance = max(view_span * 0.01, 0.02)
-        closest = int(np.argmin(diffs))
 
-        if diffs[closest] <= tolerance:
+        # peak times are sorted, so the nearest peak is one of the two
+        # neighbours of the insertion point
+        pos = int(np.searchsorted(peak_times, x))
+        left = max(pos - 1, 0)
+        right = min(pos, peak_times.size - 1)
+        closest = left if abs(peak_times[left] - x) <= abs(peak_times[right] - x) else right
+
+        if abs(peak_times[closest] - x) <= tolerance:
             peak_idx = int(peaks[closest])
             if self._hovered_peak.get(dataset) != peak_idx:
                 self._highlight_peak_on_plot(dataset, reading_key, peak_idx)
@@ -1056,25 +1216,29 @@ class CaMKIIAnalyzer:
         if reading_key not in peaks_dict:
             return
 
+        # peaks are kept sorted, so the row's peak resolves in O(log N)
         peaks = peaks_dict[reading_key]
-        indices = np.where(peaks == peak_idx)[0]
-        if indices.size == 0:
+        pos = int(np.searchsorted(peaks, peak_idx))
+        if pos >= len(peaks) or peaks[pos] != peak_idx:
             return
 
-        idx = int(indices[0])
-        peaks_dict[reading_key] = np.delete(peaks, idx)
-        if reading_key in props_dict and idx < len(props_dict[reading_key]):
-            del props_dict[reading_key][idx]
+        keep = np.ones(len(peaks), dtype=bool)
+        keep[pos] = False
+        peaks_dict[reading_key] = peaks[keep]
+        props = props_dict.get(reading_key)
+        if props is not None and pos < len(props):
+            del props[pos]
 
         if peaks_dict.get(reading_key) is not None and len(peaks_dict[reading_key]) == 0:
             peaks_dict.pop(reading_key, None)
             props_dict.pop(reading_key, None)
 
         self._clear_manual_match_override(dataset, reading_key, peak_idx)
+        self._invalidate_boundary_segs(dataset, reading_key)
 
         self.update_plot()
         self._notify_peaks_updated()
-        peak_time = float(self.time_data.iloc[peak_idx]) if peak_idx < len(self.time_data) else peak_idx
+        peak_time = float(self._time_values()[peak_idx]) if peak_idx < len(self.time_data) else peak_idx
         self._hovered_peak[dataset] = None
         self.status_bar.config(text=f"Removed {dataset} peak at {peak_time:.2f} min")
 
@@ -1099,7 +1263,7 @@ class CaMKIIAnalyzer:
             segment_end = min(length, peak_idx + window_points + 1)
 
             segment_series = series.iloc[segment_start:segment_end]
-            segment_time = self.time_data.iloc[segment_start:segment_end].values
+            segment_time = self._time_values()[segment_start:segment_end]
             segment_values = segment_series.values.astype(float)
             segment_len = len(segment_values)
 
@@ -1107,11 +1271,11 @@ class CaMKIIAnalyzer:
 
             smooth_window = max(5, int(ppm * 1.5))
             smooth_window = min(segment_len, smooth_window)
-            if smooth_window <= 1:
-                smooth_window = segment_len
-            kernel = np.ones(smooth_window, dtype=float) / max(smooth_window, 1)
             if smooth_window > 1:
-                smoothed = np.convolve(segment_values, kernel, mode='same')
+                # O(N) box filter; edge replication avoids the zero-padding
+                # dips np.convolve(mode='same') produced at segment ends
+                from scipy.ndimage import uniform_filter1d
+                smoothed = uniform_filter1d(segment_values, size=smooth_window, mode='nearest')
             else:
                 smoothed = segment_values
 
@@ -1125,26 +1289,24 @@ class CaMKIIAnalyzer:
             derivative_sign[derivative > eps] = 1.0
             derivative_sign[derivative < -eps] = -1.0
 
-            if left_base is None:
-                for i in range(peak_local_idx, 0, -1):
-                    prev_sign = derivative_sign[i - 1]
-                    curr_sign = derivative_sign[i]
-                    if prev_sign < 0 and curr_sign >= 0:
-                        left_base = segment_start + i
-                        break
+            if left_base is None and peak_local_idx > 0:
+                # nearest falling-to-flat/rising transition left of the peak
+                left_mask = (derivative_sign[:peak_local_idx] < 0) & (derivative_sign[1:peak_local_idx + 1] >= 0)
+                candidates = np.flatnonzero(left_mask)
+                if candidates.size:
+                    left_base = segment_start + int(candidates[-1]) + 1
             if (left_base is None or left_base >= peak_idx) and peak_local_idx > 0:
                 left_rel = int(np.argmin(smoothed[:peak_local_idx]))
                 left_base = segment_start + left_rel
             if left_base is None or left_base >= peak_idx:
                 left_base = max(0, peak_idx - 1)
 
-            if right_base is None:
-                for i in range(peak_local_idx, segment_len - 1):
-                    curr_sign = derivative_sign[i]
-                    next_sign = derivative_sign[i + 1]
-                    if curr_sign <= 0 and next_sign > 0:
-                        right_base = segment_start + i + 1
-                        break
+            if right_base is None and peak_local_idx < segment_len - 1:
+                # nearest flat/falling-to-rising transition right of the peak
+                right_mask = (derivative_sign[peak_local_idx:-1] <= 0) & (derivative_sign[peak_local_idx + 1:] > 0)
+                candidates = np.flatnonzero(right_mask)
+                if candidates.size:
+                    right_base = segment_start + peak_local_idx + int(candidates[0]) + 1
             if (right_base is None or right_base <= peak_idx) and peak_local_idx + 1 < segment_len:
                 right_rel = int(np.argmin(smoothed[peak_local_idx + 1:]))
                 right_base = peak_idx + 1 + right_rel
@@ -1173,11 +1335,12 @@ class CaMKIIAnalyzer:
             'baseline': baseline
         }
 
-    def _derive_peak_boundaries(self, series, peaks):
+    def _derive_peak_boundaries(self, series, peaks, data=None):
         if len(peaks) == 0:
             return []
 
-        data = series.values.astype(float)
+        if data is None:
+            data = series.values.astype(float)
         length = len(series)
         boundaries = []
 
@@ -1236,13 +1399,15 @@ class CaMKIIAnalyzer:
 
         return boundaries
 
-    def _select_hybrid_boundaries(self, series, peaks, reference_props=None):
+    def _select_hybrid_boundaries(self, series, peaks, reference_props=None, data=None):
         length = len(series)
         if len(peaks) == 0:
             return []
 
-        valley_bounds = self._derive_peak_boundaries(series, peaks)
-        width_bounds = self._peak_width_boundary_estimates(series, peaks)
+        if data is None:
+            data = series.to_numpy(dtype=np.float64)
+        valley_bounds = self._derive_peak_boundaries(series, peaks, data=data)
+        width_bounds = self._peak_width_boundary_estimates(series, peaks, data=data)
 
         reference_props = reference_props or []
         tail_margin = max(5, int(np.ceil(0.02 * length)))
@@ -1303,16 +1468,21 @@ class CaMKIIAnalyzer:
 
         return final_bounds
 
-    def _peak_width_boundary_estimates(self, series, peaks):
+    def _peak_width_boundary_estimates(self, series, peaks, data=None):
+        from scipy import signal  # deferred: keeps Tk startup light
+
         length = len(series)
         if len(peaks) == 0:
             return []
 
+        if data is None:
+            data = series.values.astype(float)
         try:
-            results = signal.peak_widths(series.values.astype(float), peaks, rel_height=1.0)
+            results = signal.peak_widths(data, peaks, rel_height=1.0)
             left_ips = np.clip(np.floor(results[2]).astype(int), 0, length - 1)
             right_ips = np.clip(np.ceil(results[3]).astype(int), 0, length - 1)
-            return list(zip(left_ips, right_ips))
+            # plain ints, not numpy scalars: consumers compare and min/max these a lot
+            return list(zip(left_ips.tolist(), right_ips.tolist()))
         except Exception:
             return [(None, None) for _ in peaks]
 
@@ -1328,7 +1498,21 @@ class CaMKIIAnalyzer:
 
         self._ensure_boundary_diag_dir()
         reading_num = reading_key.replace('#', '')
-        diagnostics_rows = []
+
+        # rows stream straight to disk instead of accumulating in memory
+        csv_path = os.path.join(
+            self._boundary_diag_dir,
+            f'reading_{reading_num}_boundary_candidates.csv'
+        )
+        csv_fieldnames = (
+            'reading', 'dataset', 'peak_index', 'peak_time_min',
+            'prev_peak_index', 'next_peak_index',
+            'scipy_left', 'scipy_right',
+            'valley_left', 'valley_right',
+            'peak_width_left', 'peak_width_right'
+        )
+        csv_file = None
+        csv_writer = None
 
         for dataset, info in payload.items():
             series = info.get('series')
@@ -1339,15 +1523,13 @@ class CaMKIIAnalyzer:
                 continue
 
             peaks_array = np.asarray(peaks, dtype=int)
-            valley_bounds = self._derive_peak_boundaries(series, peaks_array)
-            width_bounds = self._peak_width_boundary_estimates(series, peaks_array)
-
-            scipy_bounds = []
-            if props is not None:
-                for p in props:
-                    left = int(p.get('left_base', p.get('peak_idx', 0)))
-                    right = int(p.get('right_base', p.get('peak_idx', 0)))
-                    scipy_bounds.append((left, right))
+            data = series.to_numpy(dtype=np.float64)
+            valley_bounds = self._derive_peak_boundaries(series, peaks_array, data=data)
+            width_bounds = self._peak_width_boundary_estimates(series, peaks_array, data=data)
+
+            if props:
+                prop_cols = self._props_columns(props)
+                scipy_bounds = list(zip(prop_cols['left_base'], prop_cols['right_base']))
             else:
                 scipy_bounds = [(None, None) for _ in peaks_array]
 
@@ -1358,10 +1540,20 @@ class CaMKIIAnalyzer:
             while len(scipy_bounds) < len(peaks_array):
                 scipy_bounds.append((None, None))
 
-            time_values = self.time_data.values.astype(float)
-            fig, ax = plt.subplots(figsize=(12, 4))
-            ax.plot(self.time_data, series, label=f'{dataset} trace', color='#1f77b4', linewidth=1.2)
-            ax.scatter(self.time_data.iloc[peaks_array], series.iloc[peaks_array], color='black', s=15, label='Detected peaks')
+            time_values = self._time_values()
+            ax = None
+            if self._boundary_diag_figures_enabled:
+                # one diagnostics figure is kept and cleared between plots rather
+                # than constructing/destroying a pyplot figure per dataset
+                if getattr(self, '_diag_fig', None) is None:
+                    self._diag_fig = Figure(figsize=(12, 4))
+                fig = self._diag_fig
+                fig.clear()
+                ax = fig.add_subplot(111)
+                ax.plot(self.time_data, series, label=f'{dataset} trace', color='#1f77b4', linewidth=1.2)
+                ax.scatter(time_values[peaks_array], series.iloc[peaks_array], color='black', s=15, label='Detected peaks')
+
+            candidate_xs = {'#d62728': [], '#1f77b4': [], '#2ca02c': []}
 
             for idx, peak_idx in enumerate(peaks_array):
                 prev_peak = peaks_array[idx - 1] if idx > 0 else None
@@ -1371,7 +1563,11 @@ class CaMKIIAnalyzer:
                 valley_left, valley_right = valley_bounds[idx]
                 width_left, width_right = width_bounds[idx]
 
-                diagnostics_rows.append({
+                if csv_writer is None:
+                    csv_file = open(csv_path, 'w', newline='')
+                    csv_writer = csv.DictWriter(csv_file, fieldnames=csv_fieldnames)
+                    csv_writer.writeheader()
+                csv_writer.writerow({
                     'reading': reading_num,
                     'dataset': dataset,
                     'peak_index': int(peak_idx),
@@ -1386,26 +1582,40 @@ class CaMKIIAnalyzer:
                     'peak_width_right': int(width_right) if width_right is not None else ''
                 })
 
+                if ax is None:
+                    continue
+
                 candidate_lines = [
-                    (scipy_left, '#d62728', 'SciPy left'),
-                    (scipy_right, '#d62728', 'SciPy right'),
-                    (valley_left, '#1f77b4', 'Valley left'),
-                    (valley_right, '#1f77b4', 'Valley right'),
-                    (width_left, '#2ca02c', 'PeakWidth left'),
-                    (width_right, '#2ca02c', 'PeakWidth right')
+                    (scipy_left, '#d62728'),
+                    (scipy_right, '#d62728'),
+                    (valley_left, '#1f77b4'),
+                    (valley_right, '#1f77b4'),
+                    (width_left, '#2ca02c'),
+                    (width_right, '#2ca02c')
                 ]
 
-                for candidate_idx, color, label in candidate_lines:
+                for candidate_idx, color in candidate_lines:
                     if candidate_idx is None or candidate_idx == '':
                         continue
                     if not (0 <= int(candidate_idx) < len(time_values)):
                         continue
-                    ax.axvline(
-                        x=time_values[int(candidate_idx)],
-                        color=color,
-                        alpha=0.15,
-                        linestyle='--'
-                    )
+                    candidate_xs[color].append(float(time_values[int(candidate_idx)]))
+
+            if ax is None:
+                continue
+
+            # one collection per source color instead of up to 6 Line2Ds per peak
+            for color, xs in candidate_xs.items():
+                if not xs:
+                    continue
+                segments = [((x, 0.0), (x, 1.0)) for x in xs]
+                ax.add_collection(LineCollection(
+                    segments,
+                    colors=color,
+                    alpha=0.15,
+                    linestyles='--',
+                    transform=ax.get_xaxis_transform()
+                ), autolim=False)
 
             ax.set_title(f'{dataset} boundary diagnostics – Reading {reading_num}')
             ax.set_xlabel('Time (min)')
@@ -1418,15 +1628,9 @@ class CaMKIIAnalyzer:
                 f'{dataset.lower()}_reading_{reading_num}_diagnostics.png'
             )
             fig.savefig(fig_path, dpi=150)
-            plt.close(fig)
 
-        if diagnostics_rows:
-            diag_df = pd.DataFrame(diagnostics_rows)
-            csv_path = os.path.join(
-                self._boundary_diag_dir,
-                f'reading_{reading_num}_boundary_candidates.csv'
-            )
-            diag_df.to_csv(csv_path, index=False)
+        if csv_file is not None:
+            csv_file.close()
     def _rebuild_peak_properties(self, dataset, reading_key):
         peaks_dict = self.rhod_peaks if dataset == 'Rhod' else self.fret_peaks
         props_dict = self.rhod_peak_properties if dataset == 'Rhod' else self.fret_peak_properties
@@ -1440,21 +1644,84 @@ class CaMKIIAnalyzer:
             props_dict.pop(reading_key, None)
             return
 
-        sorted_indices = np.argsort(peaks)
-        peaks = peaks[sorted_indices].astype(int)
+        # callers maintain sorted order; only sort if something slipped through
+        if peaks.size > 1 and np.any(np.diff(peaks) < 0):
+            peaks = np.sort(peaks)
+        peaks = peaks.astype(int, copy=False)
         peaks_dict[reading_key] = peaks
 
         series = series_dict[reading_key]
         existing_props = props_dict.get(reading_key, [])
-        boundaries = self._select_hybrid_boundaries(series, peaks, existing_props)
-
-        new_props = []
-        for idx, (peak_idx, bounds) in enumerate(zip(peaks, boundaries)):
-            left_base, right_base = bounds
-            new_props.append(self._build_single_peak_property(dataset, series, int(peak_idx), left_base, right_base))
-        props_dict[reading_key] = new_props
+        # one float64 view shared by the valley, width and property passes
+        data = series.to_numpy(dtype=np.float64)
+        boundaries = self._select_hybrid_boundaries(series, peaks, existing_props, data=data)
+
+        # the hybrid selector always supplies both bases, so the per-peak
+        # property math reduces to clamped gathers done here in one pass
+        length = len(data)
+        left_arr = np.fromiter((b[0] for b in boundaries), dtype=np.int64, count=len(boundaries))
+        right_arr = np.fromiter((b[1] for b in boundaries), dtype=np.int64, count=len(boundaries))
+        left_arr = np.maximum(0, np.minimum(left_arr, peaks - 1))
+        right_arr = np.minimum(length - 1, np.maximum(right_arr, peaks + 1))
+
+        peak_values = data[peaks]
+        baselines = 0.5 * (data[left_arr] + data[right_arr])
+        prominences = np.maximum(0.0, peak_values - baselines)
+        widths = np.maximum(1, right_arr - left_arr).astype(float)
+
+        props_dict[reading_key] = [
+            {
+                'peak_idx': p,
+                'peak_height': pv,
+                'left_base': lb,
+                'right_base': rb,
+                'prominence': pr,
+                'width': w,
+                'baseline': b
+            }
+            for p, pv, lb, rb, pr, w, b in zip(
+                peaks.tolist(), peak_values.tolist(), left_arr.tolist(),
+                right_arr.tolist(), prominences.tolist(), widths.tolist(),
+                baselines.tolist()
+            )
+        ]
+        self._invalidate_boundary_segs(dataset, reading_key)
+
+    def _invalidate_boundary_segs(self, dataset=None, reading_key=None):
+        """Drop cached boundary segments after a peak or boundary mutation."""
+        if dataset is None:
+            for cache in self._boundary_segs.values():
+                cache.clear()
+        elif reading_key is None:
+            self._boundary_segs[dataset].clear()
+        else:
+            self._boundary_segs[dataset].pop(reading_key, None)
+
+    def _boundary_segments(self, dataset, reading_key):
+        """Cached (2K, 2, 2) segment array for a reading's peak boundaries."""
+        cache = self._boundary_segs[dataset]
+        segs = cache.get(reading_key)
+        if segs is None:
+            props_dict = self.rhod_peak_properties if dataset == 'Rhod' else self.fret_peak_properties
+            props_list = props_dict.get(reading_key) or []
+            t = self._time_values()
+            bases = np.fromiter(
+                (base for props in props_list
+                 for base in (props['left_base'], props['right_base'])),
+                dtype=np.intp, count=2 * len(props_list)
+            )
+            x = t[bases]
+            segs = np.empty((len(x), 2, 2))
+            segs[:, 0, 0] = x
+            segs[:, 1, 0] = x
+            segs[:, 0, 1] = 0.0
+            segs[:, 1, 1] = 1.0
+            cache[reading_key] = segs
+        return segs
 
     def _notify_peaks_updated(self):
+        self._peaks_version += 1
+        self._invalidate_boundary_segs()
         if getattr(self, 'edit_mode', False):
             self._refresh_edit_tables()
 
@@ -1509,16 +1776,44 @@ class CaMKIIAnalyzer:
             axis.relim()
             axis.autoscale_view()
 
-        self.canvas.draw_idle()
+        self._schedule_draw()
         self.status_bar.config(text="View reset to default")
     
+    def _read_rawdata(self, file_path):
+        """Read the 'Raw Data' sheet, keeping a Parquet sidecar for fast reloads."""
+        sidecar = file_path + '.rawdata.parquet'
+        try:
+            if os.path.exists(sidecar) and os.path.getmtime(sidecar) >= os.path.getmtime(file_path):
+                return pd.read_parquet(sidecar)
+        except Exception as exc:
+            print(f"Warning reading cached data {sidecar}: {exc}")
+
+        # only parse the columns we actually use: the shared time axis plus
+        # the '#N ...' reading columns; summary/stat columns in the sheet are
+        # dead weight. Everything kept is numeric, so fix the dtype up front.
+        time_candidates = {"Time [ms]", "Time (ms)", "Time", "Minutes"}
+        usecols = lambda name: str(name).startswith('#') or name in time_candidates
+        try:
+            # Rust-based reader is several times faster than openpyxl
+            df = pd.read_excel(file_path, sheet_name="Raw Data", engine='calamine',
+                               usecols=usecols, dtype=np.float64)
+        except (ImportError, ValueError):
+            df = pd.read_excel(file_path, sheet_name="Raw Data",
+                               usecols=usecols, dtype=np.float64)
+        try:
+            df.to_parquet(sidecar)
+        except Exception:
+            # no pyarrow/fastparquet available – skip the cache, keep working
+            pass
+        return df
+
     def load_rhod_data(self):
         try:
             file_path = filedialog.askopenfilename(
                 filetypes=[("Excel files", "*.xlsx *.xls")]
             )
             if file_path:
-                self.rhod_data = pd.read_excel(file_path, sheet_name = "Raw Data")
+                self.rhod_data = self._read_rawdata(file_path)
                 self._update_time_axis(self.rhod_data, source_label="Rhod")
                 self.normalize_rhod_data()
                 self.update_plot()
@@ -1532,7 +1827,7 @@ class CaMKIIAnalyzer:
                 filetypes=[("Excel files", "*.xlsx *.xls")]
             )
             if file_path:
-                self.fret_data = pd.read_excel(file_path, sheet_name="Raw Data")
+                self.fret_data = self._read_rawdata(file_path)
                 self._update_time_axis(self.fret_data, source_label="FRET")
                 self.normalize_fret_data()
                 self.update_plot()
@@ -1558,6 +1853,10 @@ class CaMKIIAnalyzer:
 
         if self.time_data is None:
             self.time_data = time_column.reset_index(drop=True)
+            self._time_arr = self.time_data.to_numpy(dtype=np.float64)
+            self._pts_per_min = None
+            self._time_str = None
+            self._invalidate_boundary_segs()
             return
 
         if len(time_column) != len(self.time_data):
@@ -1567,17 +1866,100 @@ class CaMKIIAnalyzer:
             )
             return
 
-        if not np.allclose(time_column.values, self.time_data.values, atol=1e-6):
+        # check endpoints first, then a strided sample – avoids a full O(N)
+        # comparison for the common case where the axes genuinely match
+        a = time_column.to_numpy()
+        b = self.time_data.to_numpy()
+        mismatch = abs(a[0] - b[0]) > 1e-6 or abs(a[-1] - b[-1]) > 1e-6
+        if not mismatch:
+            stride = max(1, len(a) // 64)
+            mismatch = not np.allclose(a[::stride], b[::stride], atol=1e-6)
+        if mismatch:
             messagebox.showwarning(
                 "Time Axis Mismatch",
                 f"{source_label} time axis values differ from the current data. Using the original timeline."
             )
 
+    def _downsample_for_plot(self, time_values, series_values):
+        """Decimate a long series to interleaved per-bin min/max pairs.
+
+        Keeps every visible pixel's extrema so peaks survive decimation;
+        short series are returned untouched. Highlights and peak markers
+        still resolve against the original full-resolution arrays.
+        """
+        y = np.asarray(series_values, dtype=float)
+        n = len(y)
+
+        try:
+            width_px = int(self.canvas.get_tk_widget().winfo_width())
+        except Exception:
+            width_px = 0
+        if width_px <= 1:
+            width_px = int(self.fig.get_size_inches()[0] * self.fig.dpi)
+
+        bins = max(2 * width_px, 2000)
+        if n <= 2 * bins:
+            return time_values, series_values
+
+        t = np.asarray(time_values, dtype=float)
+        usable = (n // bins) * bins
+        t_view = t[:usable].reshape(bins, -1)
+        y_view = y[:usable].reshape(bins, -1)
+
+        min_pos = np.argmin(y_view, axis=1)
+        max_pos = np.argmax(y_view, axis=1)
+        first = np.minimum(min_pos, max_pos)
+        second = np.maximum(min_pos, max_pos)
+        rows = np.arange(bins)
+
+        t_out = np.empty(2 * bins)
+        y_out = np.empty(2 * bins)
+        t_out[0::2] = t_view[rows, first]
+        y_out[0::2] = y_view[rows, first]
+        t_out[1::2] = t_view[rows, second]
+        y_out[1::2] = y_view[rows, second]
+
+        if usable < n:
+            t_out = np.concatenate([t_out, t[usable:]])
+            y_out = np.concatenate([y_out, y[usable:]])
+
+        return t_out, y_out
+
+    def _time_values(self):
+        """Cached float64 view of the time axis; rebuilt when the axis changes."""
+        if self.time_data is None:
+            return None
+        if getattr(self, '_time_arr', None) is None or len(self._time_arr) != len(self.time_data):
+            self._time_arr = self.time_data.to_numpy(dtype=np.float64)
+        return self._time_arr
+
+    def _nearest_time_index(self, x):
+        """Nearest sample index to time ``x`` via binary search (axis is sorted)."""
+        t = self._time_values()
+        i = int(np.searchsorted(t, x))
+        if i >= len(t):
+            return len(t) - 1
+        if i > 0 and x - t[i - 1] <= t[i] - x:
+            return i - 1
+        return i
+
+    def _time_strings(self):
+        """Time axis pre-formatted to 2 decimals for table display."""
+        arr = self._time_values()
+        if arr is None:
+            return None
+        if getattr(self, '_time_str', None) is None or len(self._time_str) != len(arr):
+            self._time_str = np.char.mod('%.2f', arr)
+        return self._time_str
+
     def _estimate_points_per_minute(self):
+        if getattr(self, '_pts_per_min', None) is not None:
+            return self._pts_per_min
+
         if self.time_data is None or len(self.time_data) < 2:
             return 1.0
 
-        diffs = np.diff(self.time_data.values)
+        diffs = np.diff(self._time_values())
         positive_diffs = diffs[diffs > 0]
         if len(positive_diffs) == 0:
             return 1.0
@@ -1586,64 +1968,108 @@ class CaMKIIAnalyzer:
         if median_step <= 0:
             return 1.0
 
-        return 1.0 / median_step
+        self._pts_per_min = 1.0 / median_step
+        return self._pts_per_min
 
-    def _rise_decay_times(self, data_series, peak_idx, left_idx, right_idx, baseline):
-        time_series = self.time_data
-        peak_value = float(data_series.iloc[peak_idx])
+    def _rise_decay_times(self, d_arr, t_arr, peak_idx, left_idx, right_idx, baseline):
+        peak_value = float(d_arr[peak_idx])
         amplitude = peak_value - baseline
         if amplitude <= 0:
             return 0.0, 0.0
 
         threshold = baseline + 0.1 * amplitude
 
-        rise_idx = left_idx
-        for idx in range(left_idx, peak_idx + 1):
-            if data_series.iloc[idx] >= threshold:
-                rise_idx = idx
-                break
+        # first index at/after left_idx crossing the threshold on the way up
+        rise_idx = _first_crossing_ge(d_arr, left_idx, peak_idx, threshold)
+        if rise_idx < 0:
+            rise_idx = left_idx
 
-        decay_idx = right_idx
-        for idx in range(peak_idx, right_idx + 1):
-            if data_series.iloc[idx] <= threshold:
-                decay_idx = idx
-                break
+        # first index at/after the peak dropping back through the threshold
+        decay_idx = _first_crossing_le(d_arr, peak_idx, right_idx, threshold)
+        if decay_idx < 0:
+            decay_idx = right_idx
 
-        rise_time = float(time_series.iloc[peak_idx] - time_series.iloc[rise_idx])
-        decay_time = float(time_series.iloc[decay_idx] - time_series.iloc[peak_idx])
+        rise_time = float(t_arr[peak_idx] - t_arr[rise_idx])
+        decay_time = float(t_arr[decay_idx] - t_arr[peak_idx])
 
         return max(rise_time, 0.0), max(decay_time, 0.0)
 
+    @staticmethod
+    def _props_from_find_peaks(peaks, props):
+        """Convert scipy find_peaks output arrays into per-peak property dicts."""
+        return [
+            {
+                'peak_idx': int(peak),
+                'peak_height': float(height),
+                'left_base': int(left),
+                'right_base': int(right),
+                'prominence': float(prominence),
+                'width': float(width)
+            }
+            for peak, height, left, right, prominence, width in zip(
+                peaks,
+                props['peak_heights'],
+                props['left_bases'],
+                props['right_bases'],
+                props['prominences'],
+                props['widths']
+            )
+        ]
+
+    @staticmethod
+    def _props_columns(peak_properties):
+        """Gather the list-of-dict peak properties into columnar ndarrays."""
+        count = len(peak_properties)
+        return {
+            'peak_idx': np.fromiter((p['peak_idx'] for p in peak_properties), dtype=int, count=count),
+            'left_base': np.fromiter((p['left_base'] for p in peak_properties), dtype=int, count=count),
+            'right_base': np.fromiter((p['right_base'] for p in peak_properties), dtype=int, count=count),
+            'baseline': np.fromiter(
+                (p.get('baseline') if p.get('baseline') is not None else np.nan for p in peak_properties),
+                dtype=float, count=count
+            )
+        }
+
     def _collect_peak_metrics(self, data_series, peak_properties):
         metrics = []
-        if self.time_data is None:
+        if self.time_data is None or not peak_properties:
             return metrics
 
-        trapezoid = getattr(np, 'trapezoid', np.trapz)
-
-        for idx, props in enumerate(peak_properties):
-            peak_idx = props['peak_idx']
-            left_idx = max(0, props['left_base'])
-            right_idx = min(len(data_series) - 1, props['right_base'])
-
-            baseline_candidates = [
-                props.get('baseline'),
-                float(data_series.iloc[left_idx]),
-                float(data_series.iloc[right_idx])
-            ]
-            baseline_values = [val for val in baseline_candidates if val is not None and not np.isnan(val)]
-            baseline = float(min(baseline_values)) if baseline_values else float(data_series.min())
-
-            peak_value = float(data_series.iloc[peak_idx])
-            amplitude = max(0.0, peak_value - baseline)
-
-            time_segment = self.time_data.iloc[left_idx:right_idx+1].values
-            signal_segment = data_series.iloc[left_idx:right_idx+1].values
-            auc = trapezoid(signal_segment - baseline, time_segment)
-            auc = max(0.0, float(auc))
-
-            rise_time, decay_time = self._rise_decay_times(data_series, peak_idx, left_idx, right_idx, baseline)
-            width = float(self.time_data.iloc[right_idx] - self.time_data.iloc[left_idx])
+        data = data_series.to_numpy(dtype=float)
+        t = self._time_values()
+        length = len(data)
+
+        cols = self._props_columns(peak_properties)
+        peak_arr = cols['peak_idx']
+        # clamp bounds around the peak as _rebuild_peak_properties does;
+        # boundary estimates near the trace edges can land past the peak
+        left_arr = np.maximum(0, np.minimum(cols['left_base'], peak_arr - 1))
+        right_arr = np.minimum(length - 1, np.maximum(cols['right_base'], peak_arr + 1))
+        prop_baseline = cols['baseline']
+
+        # NaN-aware min across the candidate baselines; fall back to the series minimum
+        baselines = np.fmin(np.fmin(prop_baseline, data[left_arr]), data[right_arr])
+        baselines = np.where(np.isnan(baselines), np.nanmin(data), baselines)
+
+        peak_values = data[peak_arr]
+        amplitudes = np.maximum(0.0, peak_values - baselines)
+        widths = t[right_arr] - t[left_arr]
+
+        # cumulative trapezoid so each peak's integral is a pair of lookups
+        cum = np.concatenate(([0.0], np.cumsum(0.5 * (data[:-1] + data[1:]) * np.diff(t))))
+        aucs = np.maximum(0.0, (cum[right_arr] - cum[left_arr]) - baselines * widths)
+
+        for idx in range(len(peak_properties)):
+            peak_idx = int(peak_arr[idx])
+            left_idx = int(left_arr[idx])
+            right_idx = int(right_arr[idx])
+            baseline = float(baselines[idx])
+            peak_value = float(peak_values[idx])
+            amplitude = float(amplitudes[idx])
+            auc = float(aucs[idx])
+            width = float(widths[idx])
+
+            rise_time, decay_time = self._rise_decay_times(data, t, peak_idx, left_idx, right_idx, baseline)
 
             metrics.append({
                 'ordinal': idx + 1,
@@ -1665,89 +2091,240 @@ class CaMKIIAnalyzer:
         if not rhod_metrics or not fret_metrics:
             return []
 
-        rhod_sorted = sorted(rhod_metrics, key=lambda m: self.time_data.iloc[m['peak_idx']])
-        fret_sorted = sorted(fret_metrics, key=lambda m: self.time_data.iloc[m['peak_idx']])
-        used_fret = set()
+        t = self._time_values()
+        rhod_idx = np.fromiter((m['peak_idx'] for m in rhod_metrics), dtype=np.int64, count=len(rhod_metrics))
+        fret_idx = np.fromiter((m['peak_idx'] for m in fret_metrics), dtype=np.int64, count=len(fret_metrics))
+        rhod_t = t[rhod_idx]
+        fret_t = t[fret_idx]
+
+        rhod_order = np.argsort(rhod_t, kind='stable')
+        fret_order = np.argsort(fret_t, kind='stable')
+        fret_t_sorted = fret_t[fret_order]
+
+        # Two-pointer sweep: walking Rhod peaks in time order, each one's best
+        # partner is the earliest unused FRET peak strictly after it, so a
+        # single forward pointer replaces the nested candidate scan. This is
+        # O(N log N) already; a broadcast (N_rhod, N_fret) delay matrix with
+        # repeated argmin would cost more and pair peaks in a different,
+        # globally-greedy order than the chronological assignment used here.
         pairs = []
+        ptr = 0
+        n_fret = len(fret_order)
+
+        for oi in rhod_order:
+            rhod_time = float(rhod_t[oi])
+            start = int(np.searchsorted(fret_t_sorted, rhod_time, side='right'))
+            if start > ptr:
+                ptr = start
+            if ptr >= n_fret:
+                break
 
-        for rhod_metric in rhod_sorted:
-            rhod_time = float(self.time_data.iloc[rhod_metric['peak_idx']])
-            best_candidate = None
-            best_delay = None
-
-            for fret_metric in fret_sorted:
-                if fret_metric['peak_idx'] in used_fret:
-                    continue
-
-                fret_time = float(self.time_data.iloc[fret_metric['peak_idx']])
-                if fret_time <= rhod_time:
-                    continue
-
-                delay = fret_time - rhod_time
-                if best_delay is None or delay < best_delay:
-                    best_delay = delay
-                    best_candidate = fret_metric
-
-            if best_candidate is not None:
-                used_fret.add(best_candidate['peak_idx'])
-                pairs.append({
-                    'rhod': rhod_metric,
-                    'fret': best_candidate,
-                    'delay': best_delay
-                })
+            fret_pos = int(fret_order[ptr])
+            pairs.append({
+                'rhod': rhod_metrics[int(oi)],
+                'fret': fret_metrics[fret_pos],
+                'delay': float(fret_t_sorted[ptr] - rhod_time)
+            })
+            ptr += 1
 
         return pairs
     
+    @staticmethod
+    def _reading_columns_matrix(dataframe, cols):
+        """Pull the reading columns into one float64 matrix."""
+        sub = dataframe[cols]
+        try:
+            return sub.to_numpy(dtype=np.float64)
+        except (TypeError, ValueError):
+            # coerce stray non-numeric cells to NaN rather than failing the load
+            return sub.apply(pd.to_numeric, errors='coerce').to_numpy(dtype=np.float64)
+
     def normalize_rhod_data(self):
-        if self.rhod_data is not None:
-            self.rhod_normalized.clear()
-
-            for col in self.rhod_data.columns:
-                if col.startswith('#'):
-                    try:
-                        reading_num = col.split()[0].replace('#', '')
-                        average = self.rhod_data[col].iloc[:6].mean()
-                        normalized = self.rhod_data[col] / average
-                        self.rhod_normalized[f'#{reading_num}'] = normalized
-                    except Exception as e:
-                        print(f"Error normalizing column {col}: {str(e)}")
+        if self.rhod_data is None:
+            return
 
-    
-    def normalize_fret_data(self):
-        if self.fret_data is not None:
-            self.fret_normalized.clear()
-
-            for col in self.fret_data.columns:
-                if col.startswith('#') and not col.endswith('_norm'):
-                    try:
-                        reading_num = col.split()[0].replace('#', '')
-                        inverted = 1 / self.fret_data[col]
-                        # Normalize by first 6 readings
-                        average = inverted.iloc[:6].mean()
-                        normalized = inverted/average
-                        self.fret_normalized[f'#{reading_num}'] = normalized
-
-                    except Exception as e:
-                        print(f"Error normalizing column {col}: {str(e)}")
-    
-    def update_plot(self):
-        reading = int(self.reading_var.get())
-        reading_key = f'#{reading}'
-        overlay_mode = self.overlay_var.get()
+        self.rhod_normalized.clear()
+        self._rhod_arr.clear()
+        self._baseline_cache.clear()
+        self._edit_cache = None
+        self._last_plot_key = None
 
-        self._clear_peak_highlight('Rhod', suppress_draw=True)
-        self._clear_peak_highlight('FRET', suppress_draw=True)
+        # reading key -> column name, built once per load and reused below
+        self._rhod_reading_cols = {
+            f"#{c.split()[0].replace('#', '')}": c
+            for c in self.rhod_data.columns if c.startswith('#')
+        }
+        cols = list(self._rhod_reading_cols.values())
+        if not cols:
+            return
 
-        stored_xlim = self.ax1.get_xlim() if self.ax1.has_data() else None
+        try:
+            arr = self._reading_columns_matrix(self.rhod_data, cols)
+            averages = arr[:6].mean(axis=0)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                normalized = arr / averages
+        except Exception as e:
+            print(f"Error normalizing Rhod data: {str(e)}")
+            return
 
-        self.ax1.clear()
-        self.ax1.set_ylabel('FRET change')
+        index = self.rhod_data.index
+        for i, reading_key in enumerate(self._rhod_reading_cols):
+            # store as float32: F/F0 ratios are O(1) so ~7 significant digits
+            # is ample, and plotting/detection are memory-bound on long traces
+            column = np.ascontiguousarray(normalized[:, i], dtype=np.float32)
+            self.rhod_normalized[reading_key] = pd.Series(column, index=index)
+            self._rhod_arr[reading_key] = column
 
-        if hasattr(self, '_hovered_peak'):
-            self._hovered_peak = {'Rhod': None, 'FRET': None}
-        if hasattr(self, '_table_widgets'):
-            self._clear_table_highlight('Rhod', suppress_plot=True)
-            self._clear_table_highlight('FRET', suppress_plot=True)
+    def normalize_fret_data(self):
+        if self.fret_data is None:
+            return
+
+        self.fret_normalized.clear()
+        self._fret_arr.clear()
+        self._baseline_cache.clear()
+        self._edit_cache = None
+        self._last_plot_key = None
+
+        self._fret_reading_cols = {
+            f"#{c.split()[0].replace('#', '')}": c
+            for c in self.fret_data.columns
+            if c.startswith('#') and not c.endswith('_norm')
+        }
+        cols = list(self._fret_reading_cols.values())
+        if not cols:
+            return
+
+        try:
+            arr = self._reading_columns_matrix(self.fret_data, cols)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                inverted = 1.0 / arr
+                # Normalize by first 6 readings
+                averages = inverted[:6].mean(axis=0)
+                normalized = inverted / averages
+        except Exception as e:
+            print(f"Error normalizing FRET data: {str(e)}")
+            return
+
+        index = self.fret_data.index
+        for i, reading_key in enumerate(self._fret_reading_cols):
+            column = np.ascontiguousarray(normalized[:, i], dtype=np.float32)
+            self.fret_normalized[reading_key] = pd.Series(column, index=index)
+            self._fret_arr[reading_key] = column
+    
+    def _make_plot_artists(self, overlay_mode, rhod_axis, has_fret, has_rhod):
+        """Create the persistent line/marker artists after a layout rebuild."""
+        fret_line, = self.ax1.plot([], [], color=self.fret_color, label='FRET')
+        rhod_line, = rhod_axis.plot([], [], color=self.rhod_color, label='Rhod-2')
+        fret_peak_line, = self.ax1.plot([], [], 'x', color=self._boundary_color,
+                                        markersize=7, label='_nolegend_')
+        rhod_peak_line, = rhod_axis.plot([], [], 'x', color=self._boundary_color,
+                                         markersize=7, label='_nolegend_')
+        # one collection per channel holds every boundary vertical; x in data
+        # coords, y spanning the axis via the x-axis transform (like axvline)
+        fret_bounds = LineCollection([], colors=self._boundary_color, linestyles='--',
+                                     alpha=0.35, transform=self.ax1.get_xaxis_transform())
+        self.ax1.add_collection(fret_bounds, autolim=False)
+        rhod_bounds = LineCollection([], colors=self._boundary_color, linestyles='--',
+                                     alpha=0.35, transform=rhod_axis.get_xaxis_transform())
+        rhod_axis.add_collection(rhod_bounds, autolim=False)
+        self._plot_artists = {
+            'overlay_mode': overlay_mode,
+            'rhod_axis': rhod_axis,
+            'has_fret': has_fret,
+            'has_rhod': has_rhod,
+            'fret_line': fret_line,
+            'rhod_line': rhod_line,
+            'fret_peak_line': fret_peak_line,
+            'rhod_peak_line': rhod_peak_line,
+            'fret_bounds': fret_bounds,
+            'rhod_bounds': rhod_bounds
+        }
+        return self._plot_artists
+
+    def _apply_plot_data(self, reading_key, artists):
+        """Push the current reading into the persistent artists via set_data."""
+        rhod_axis = artists['rhod_axis']
+
+        if artists['has_fret']:
+            fret_series = self.fret_normalized[reading_key]
+            t_plot, y_plot = self._downsample_for_plot(self.time_data, fret_series)
+            artists['fret_line'].set_data(t_plot, y_plot)
+        else:
+            artists['fret_line'].set_data([], [])
+
+        if artists['has_rhod']:
+            rhod_series = self.rhod_normalized[reading_key]
+            t_plot, y_plot = self._downsample_for_plot(self.time_data, rhod_series)
+            artists['rhod_line'].set_data(t_plot, y_plot)
+        else:
+            artists['rhod_line'].set_data([], [])
+
+        self._apply_peak_artists(reading_key, artists)
+
+        for axis in (self.ax1, rhod_axis):
+            axis.relim()
+            axis.autoscale_view()
+
+    def _apply_peak_artists(self, reading_key, artists):
+        """Refresh peak markers and boundary lines for the current reading."""
+        t = self._time_values()
+        show_bounds = self.show_boundaries_var.get()
+
+        for dataset, marker_key, bounds_key in (
+            ('Rhod', 'rhod_peak_line', 'rhod_bounds'),
+            ('FRET', 'fret_peak_line', 'fret_bounds')
+        ):
+            peaks_dict = self.rhod_peaks if dataset == 'Rhod' else self.fret_peaks
+            props_dict = self.rhod_peak_properties if dataset == 'Rhod' else self.fret_peak_properties
+            arr_dict = self._rhod_arr if dataset == 'Rhod' else self._fret_arr
+            has_data = artists['has_rhod'] if dataset == 'Rhod' else artists['has_fret']
+
+            marker = artists[marker_key]
+            bounds_lc = artists[bounds_key]
+            peaks = peaks_dict.get(reading_key)
+            series_arr = arr_dict.get(reading_key)
+
+            boundary_segs = []
+            if has_data and peaks is not None and len(peaks) > 0 and series_arr is not None:
+                marker.set_data(t[peaks], series_arr[peaks])
+                marker.set_label(f'{dataset} peaks ({len(peaks)})')
+
+                if show_bounds and reading_key in props_dict:
+                    boundary_segs = self._boundary_segments(dataset, reading_key)
+            else:
+                marker.set_data([], [])
+                marker.set_label('_nolegend_')
+            bounds_lc.set_segments(boundary_segs)
+
+    def _refresh_plot_legends(self, overlay_mode, rhod_axis):
+        handles1, labels1 = self.ax1.get_legend_handles_labels()
+        handles2, labels2 = rhod_axis.get_legend_handles_labels()
+
+        # legend entries only change with the layout or the peak-count labels,
+        # so skip the legend rebuild entirely when nothing visible changed
+        signature = (overlay_mode, tuple(labels1), tuple(labels2))
+        if signature == self._legend_sig:
+            return
+        self._legend_sig = signature
+
+        if overlay_mode:
+            if handles1 or handles2:
+                legend_map = {label: handle for handle, label in zip(handles1 + handles2, labels1 + labels2)}
+                self.ax1.legend(list(legend_map.values()), list(legend_map.keys()), loc='upper right')
+        else:
+            if handles1:
+                legend_map = {label: handle for handle, label in zip(handles1, labels1)}
+                self.ax1.legend(list(legend_map.values()), list(legend_map.keys()))
+
+            if handles2:
+                legend_map = {label: handle for handle, label in zip(handles2, labels2)}
+                rhod_axis.legend(list(legend_map.values()), list(legend_map.keys()))
+
+    def _rebuild_plot_axes(self, reading_key, overlay_mode, has_fret, has_rhod):
+        """Full clear-and-replot path, used when the axis layout changes."""
+        self._legend_sig = None  # ax.clear() discards the legends
+        self.ax1.clear()
+        self.ax1.set_ylabel('FRET change')
 
         if overlay_mode:
             self.ax_overlay.set_visible(True)
@@ -1755,6 +2332,7 @@ class CaMKIIAnalyzer:
             self.ax_overlay.set_ylabel('Rhod-2 (F/F0)')
             self.ax2.clear()
             self.ax2.set_visible(False)
+            self.ax1.set_xlabel('Time (min)')
         else:
             self.ax_overlay.clear()
             self.ax_overlay.set_visible(False)
@@ -1762,96 +2340,80 @@ class CaMKIIAnalyzer:
             self.ax2.clear()
             self.ax2.set_ylabel('Rhod-2 (F/F0)')
             self.ax2.set_xlabel('Time (min)')
+            self.ax1.set_xlabel('')
+
+        rhod_axis = self.ax_overlay if overlay_mode else self.ax2
 
         if self.time_data is None:
+            self._plot_artists = None
             self.ax1.text(0.5, 0.5, 'Load data to start', transform=self.ax1.transAxes,
                           ha='center', va='center', fontsize=12, color='gray')
-            if overlay_mode:
-                self.ax1.set_xlabel('Time (min)')
-            else:
+            if not overlay_mode:
                 self.ax2.text(0.5, 0.5, 'Waiting for data', transform=self.ax2.transAxes,
                               ha='center', va='center', fontsize=12, color='gray')
-            self.status_bar.config(text="Load a dataset to start plotting")
-            self.canvas.draw_idle()
-            return
+            return rhod_axis, False
 
-        has_fret = reading_key in self.fret_normalized
-        has_rhod = reading_key in self.rhod_normalized
-        rhod_axis = self.ax_overlay if overlay_mode else self.ax2
-        plotted_any = False
-
-        if has_fret:
-            fret_series = self.fret_normalized[reading_key]
-            self.ax1.plot(self.time_data, fret_series, color=self.fret_color, label='FRET')
-            plotted_any = True
-        else:
+        if not has_fret:
             self.ax1.text(0.5, 0.5, 'Reading missing in FRET file', transform=self.ax1.transAxes,
                           ha='center', va='center', fontsize=12, color='gray')
-
-        if has_rhod:
-            rhod_series = self.rhod_normalized[reading_key]
-            rhod_axis.plot(self.time_data, rhod_series, color=self.rhod_color, label='Rhod-2')
-            if not overlay_mode:
-                rhod_axis.set_xlabel('Time (min)')
-            plotted_any = True
-        else:
+        if not has_rhod:
             rhod_axis.text(0.5, 0.5, 'Reading missing in Rhod file', transform=rhod_axis.transAxes,
                            ha='center', va='center', fontsize=12, color='gray')
 
-        boundary_color = '#4c72b0'
-
-        if has_rhod and reading_key in self.rhod_peaks:
-            rhod_peaks = self.rhod_peaks[reading_key]
-            rhod_axis.plot(self.time_data[rhod_peaks],
-                           rhod_series.iloc[rhod_peaks],
-                           'x', color=boundary_color, markersize=7,
-                           label=f'Rhod peaks ({len(rhod_peaks)})')
-
-            if self.show_boundaries_var.get() and reading_key in self.rhod_peak_properties:
-                for props in self.rhod_peak_properties[reading_key]:
-                    left_time = self.time_data[props['left_base']]
-                    right_time = self.time_data[props['right_base']]
-                    rhod_axis.axvline(x=left_time, color=boundary_color, linestyle='--', alpha=0.35)
-                    rhod_axis.axvline(x=right_time, color=boundary_color, linestyle='--', alpha=0.35)
-
-        if has_fret and reading_key in self.fret_peaks:
-            fret_peaks = self.fret_peaks[reading_key]
-            self.ax1.plot(self.time_data[fret_peaks],
-                          fret_series.iloc[fret_peaks],
-                          'x', color=boundary_color, markersize=7,
-                          label=f'FRET peaks ({len(fret_peaks)})')
-
-            if self.show_boundaries_var.get() and reading_key in self.fret_peak_properties:
-                for props in self.fret_peak_properties[reading_key]:
-                    left_time = self.time_data[props['left_base']]
-                    right_time = self.time_data[props['right_base']]
-                    self.ax1.axvline(x=left_time, color=boundary_color, linestyle='--', alpha=0.35)
-                    self.ax1.axvline(x=right_time, color=boundary_color, linestyle='--', alpha=0.35)
+        artists = self._make_plot_artists(overlay_mode, rhod_axis, has_fret, has_rhod)
+        self._apply_plot_data(reading_key, artists)
+        return rhod_axis, has_fret or has_rhod
 
-        if overlay_mode:
-            self.ax1.set_xlabel('Time (min)')
-            handles1, labels1 = self.ax1.get_legend_handles_labels()
-            handles2, labels2 = rhod_axis.get_legend_handles_labels()
-            if handles1 or handles2:
-                legend_map = {label: handle for handle, label in zip(handles1 + handles2, labels1 + labels2)}
-                legend_handles = list(legend_map.values())
-                legend_labels = list(legend_map.keys())
-                self.ax1.legend(legend_handles, legend_labels, loc='upper right')
+    def update_plot(self):
+        reading = int(self.reading_var.get())
+        reading_key = f'#{reading}'
+        overlay_mode = self.overlay_var.get()
+
+        self._clear_peak_highlight('Rhod', suppress_draw=True)
+        self._clear_peak_highlight('FRET', suppress_draw=True)
+
+        stored_xlim = self.ax1.get_xlim() if self.ax1.has_data() else None
+
+        if hasattr(self, '_hovered_peak'):
+            self._hovered_peak = {'Rhod': None, 'FRET': None}
+        if hasattr(self, '_table_widgets'):
+            self._clear_table_highlight('Rhod', suppress_plot=True)
+            self._clear_table_highlight('FRET', suppress_plot=True)
+
+        has_fret = self.time_data is not None and reading_key in self.fret_normalized
+        has_rhod = self.time_data is not None and reading_key in self.rhod_normalized
+
+        plot_key = (reading_key, self._peaks_version, overlay_mode,
+                    self.show_boundaries_var.get())
+
+        artists = getattr(self, '_plot_artists', None)
+        if (artists is not None
+                and artists['overlay_mode'] == overlay_mode
+                and artists['has_fret'] == has_fret
+                and artists['has_rhod'] == has_rhod
+                and self.time_data is not None):
+            # layout unchanged – rewrite artist data instead of rebuilding axes
+            rhod_axis = artists['rhod_axis']
+            if (self._last_plot_key is not None
+                    and reading_key == self._last_plot_key[0]):
+                # same reading since the last repaint: the traces are already
+                # set, only peak markers/boundaries may have changed (peak
+                # edits, boundary drags, visibility toggle)
+                self._apply_peak_artists(reading_key, artists)
+            else:
+                self._apply_plot_data(reading_key, artists)
+            plotted_any = has_fret or has_rhod
         else:
-            self.ax1.set_xlabel('')
-            handles1, labels1 = self.ax1.get_legend_handles_labels()
-            if handles1:
-                legend_map = {label: handle for handle, label in zip(handles1, labels1)}
-                legend_handles = list(legend_map.values())
-                legend_labels = list(legend_map.keys())
-                self.ax1.legend(legend_handles, legend_labels)
+            rhod_axis, plotted_any = self._rebuild_plot_axes(reading_key, overlay_mode, has_fret, has_rhod)
 
-            handles2, labels2 = rhod_axis.get_legend_handles_labels()
-            if handles2:
-                legend_map = {label: handle for handle, label in zip(handles2, labels2)}
-                legend_handles = list(legend_map.values())
-                legend_labels = list(legend_map.keys())
-                rhod_axis.legend(legend_handles, legend_labels)
+        if self.time_data is None:
+            self._last_plot_key = None
+            self.status_bar.config(text="Load a dataset to start plotting")
+            self._schedule_draw()
+            return
+
+        self._last_plot_key = plot_key
+        self._refresh_plot_legends(overlay_mode, rhod_axis)
 
         if self.time_data is not None and stored_xlim is not None:
             full_min = float(self.time_data.min())
@@ -1868,7 +2430,7 @@ class CaMKIIAnalyzer:
                 rhod_axis.set_xlim(stored_xlim)
 
         self.fig.suptitle(self.plot_title)
-        self.canvas.draw_idle()
+        self._schedule_draw()
 
         if plotted_any:
             self.status_bar.config(text=f"Showing reading #{reading}")
@@ -1967,58 +2529,204 @@ class CaMKIIAnalyzer:
             messagebox.showwarning("Warning", f"Reading {reading} not found in {label} data.")
             return
 
-        self._reset_manual_matches(reading_key)
-
         rhod_data = self.rhod_normalized[reading_key]
         fret_data = self.fret_normalized[reading_key]
 
+        # Run detection on the cached contiguous arrays, not the Series.
+        # Detection deliberately stays on scipy's find_peaks rather than a
+        # hand-fused kernel: its prominence/width/plateau semantics are what
+        # every downstream boundary and metric step assumes, and its core
+        # already runs in C on these arrays.
+        rhod_arr = self._rhod_arr.get(reading_key)
+        if rhod_arr is None:
+            rhod_arr = np.ascontiguousarray(rhod_data.to_numpy(dtype=np.float32))
+            self._rhod_arr[reading_key] = rhod_arr
+        fret_arr = self._fret_arr.get(reading_key)
+        if fret_arr is None:
+            fret_arr = np.ascontiguousarray(fret_data.to_numpy(dtype=np.float32))
+            self._fret_arr[reading_key] = fret_arr
+
         rhod_params = self._get_detection_params('Rhod')
         fret_params = self._get_detection_params('FRET')
         if rhod_params is None or fret_params is None:
             return
 
-        rhod_peaks, rhod_props = signal.find_peaks(
-            rhod_data,
-            height=rhod_params['height'],
-            distance=rhod_params['distance'],
-            prominence=rhod_params['prominence'],
-            width=rhod_params['width']
+        if getattr(self, '_detect_in_progress', False):
+            self.status_bar.config(text="Peak detection already running…")
+            return
+
+        # numeric work runs off the Tk thread; results are marshalled back
+        # via root.after so every widget/dict write stays on the main thread
+        self._detect_in_progress = True
+        self.status_bar.config(text=f"Detecting peaks for Reading {reading}…")
+        worker = threading.Thread(
+            target=self._detect_peaks_worker,
+            args=(reading_key, rhod_data, fret_data, rhod_arr, fret_arr,
+                  rhod_params, fret_params),
+            daemon=True
         )
+        worker.start()
+
+    def detect_all_readings(self):
+        """Run detection for every reading present in both datasets at once."""
+        if self.rhod_data is None or self.fret_data is None:
+            messagebox.showwarning("Warning", "Please load both Rhod and FRET data first.")
+            return
+
+        shared_keys = [key for key in self.rhod_normalized if key in self.fret_normalized]
+        shared_keys.sort(key=lambda key: int(key[1:]))
+        if not shared_keys:
+            messagebox.showwarning("Warning", "No reading present in both Rhod and FRET data.")
+            return
 
-        fret_peaks, fret_props = signal.find_peaks(
-            fret_data,
-            height=fret_params['height'],
-            distance=fret_params['distance'],
-            prominence=fret_params['prominence'],
-            width=fret_params['width']
+        rhod_params = self._get_detection_params('Rhod')
+        fret_params = self._get_detection_params('FRET')
+        if rhod_params is None or fret_params is None:
+            return
+
+        if getattr(self, '_detect_in_progress', False):
+            self.status_bar.config(text="Peak detection already running…")
+            return
+
+        jobs = []
+        for reading_key in shared_keys:
+            rhod_series = self.rhod_normalized[reading_key]
+            fret_series = self.fret_normalized[reading_key]
+            rhod_arr = self._rhod_arr.get(reading_key)
+            if rhod_arr is None:
+                rhod_arr = np.ascontiguousarray(rhod_series.to_numpy(dtype=np.float32))
+                self._rhod_arr[reading_key] = rhod_arr
+            fret_arr = self._fret_arr.get(reading_key)
+            if fret_arr is None:
+                fret_arr = np.ascontiguousarray(fret_series.to_numpy(dtype=np.float32))
+                self._fret_arr[reading_key] = fret_arr
+            jobs.append((reading_key, rhod_series, fret_series, rhod_arr, fret_arr))
+
+        self._detect_in_progress = True
+        self.status_bar.config(text=f"Detecting peaks for {len(jobs)} readings…")
+        worker = threading.Thread(
+            target=self._detect_all_worker,
+            args=(jobs, rhod_params, fret_params),
+            daemon=True
         )
+        worker.start()
+
+    def _detect_all_worker(self, jobs, rhod_params, fret_params):
+        results = [
+            self._detect_single_reading(reading_key, rhod_series, fret_series,
+                                        rhod_arr, fret_arr, rhod_params, fret_params)
+            for reading_key, rhod_series, fret_series, rhod_arr, fret_arr in jobs
+        ]
+        self.root.after(0, self._apply_detected_peaks_batch, results)
+
+    def _apply_detected_peaks_batch(self, results):
+        self._detect_in_progress = False
+
+        failed = [result for result in results if result['error'] is not None]
+        applied = 0
+        for result in results:
+            if result['error'] is None:
+                self._store_detected_peaks(result)
+                applied += 1
 
-        rhod_peak_properties = []
-        for i in range(len(rhod_peaks)):
-            properties = {
-                'peak_idx': int(rhod_peaks[i]),
-                'peak_height': float(rhod_props['peak_heights'][i]),
-                'left_base': int(rhod_props['left_bases'][i]),
-                'right_base': int(rhod_props['right_bases'][i]),
-                'prominence': float(rhod_props['prominences'][i]),
-                'width': float(rhod_props['widths'][i])
-            }
-            rhod_peak_properties.append(properties)
-
-        fret_peak_properties = []
-        for i in range(len(fret_peaks)):
-            properties = {
-                'peak_idx': int(fret_peaks[i]),
-                'peak_height': float(fret_props['peak_heights'][i]),
-                'left_base': int(fret_props['left_bases'][i]),
-                'right_base': int(fret_props['right_bases'][i]),
-                'prominence': float(fret_props['prominences'][i]),
-                'width': float(fret_props['widths'][i])
+        self.update_plot()
+
+        summary = f"Detected peaks for {applied} readings."
+        if failed:
+            labels = ', '.join(result['reading_key'] for result in failed)
+            summary += f" Failed: {labels}."
+            messagebox.showerror(
+                "Peak Detection",
+                f"Detection failed for {labels}: {failed[0]['error']}"
+            )
+        self.status_bar.config(text=summary)
+        self._notify_peaks_updated()
+
+    def _detect_peaks_worker(self, reading_key, rhod_data, fret_data,
+                             rhod_arr, fret_arr, rhod_params, fret_params):
+        result = self._detect_single_reading(reading_key, rhod_data, fret_data,
+                                             rhod_arr, fret_arr, rhod_params, fret_params)
+        self.root.after(0, self._apply_detected_peaks, result)
+
+    def _detect_single_reading(self, reading_key, rhod_data, fret_data,
+                               rhod_arr, fret_arr, rhod_params, fret_params):
+        from scipy import signal  # deferred: keeps Tk startup light
+
+        try:
+            rhod_peaks, rhod_props = signal.find_peaks(
+                rhod_arr,
+                height=rhod_params['height'],
+                distance=rhod_params['distance'],
+                prominence=rhod_params['prominence'],
+                width=rhod_params['width']
+            )
+
+            fret_peaks, fret_props = signal.find_peaks(
+                fret_arr,
+                height=fret_params['height'],
+                distance=fret_params['distance'],
+                prominence=fret_params['prominence'],
+                width=fret_params['width']
+            )
+
+            rhod_peaks = np.array(rhod_peaks, dtype=int)
+            fret_peaks = np.array(fret_peaks, dtype=int)
+            rhod_peak_properties = self._props_from_find_peaks(rhod_peaks, rhod_props)
+            fret_peak_properties = self._props_from_find_peaks(fret_peaks, fret_props)
+
+            result = {
+                'reading_key': reading_key,
+                'rhod_data': rhod_data,
+                'fret_data': fret_data,
+                'rhod_peaks': rhod_peaks,
+                'fret_peaks': fret_peaks,
+                'rhod_props': rhod_peak_properties,
+                'fret_props': fret_peak_properties,
+                'rhod_params': rhod_params,
+                'fret_params': fret_params,
+                'rhod_hybrid': self._select_hybrid_boundaries(rhod_data, rhod_peaks, rhod_peak_properties),
+                'fret_hybrid': self._select_hybrid_boundaries(fret_data, fret_peaks, fret_peak_properties),
+                'error': None
             }
-            fret_peak_properties.append(properties)
+        except Exception as e:
+            result = {'reading_key': reading_key, 'error': str(e)}
+
+        return result
+
+    def _apply_detected_peaks(self, result):
+        self._detect_in_progress = False
+        reading_key = result['reading_key']
+
+        if result['error'] is not None:
+            self.status_bar.config(text="Peak detection failed")
+            messagebox.showerror("Peak Detection", f"Detection failed: {result['error']}")
+            return
+
+        rhod_params = result['rhod_params']
+        fret_params = result['fret_params']
+        self._store_detected_peaks(result)
+        self.update_plot()
+
+        summary = (
+            f"Detected {len(self.rhod_peaks[reading_key])} Rhod peaks (h={rhod_params['height']}, "
+            f"prom={rhod_params['prominence']}, dist={rhod_params['distance']}, w={rhod_params['width']}) and "
+            f"{len(self.fret_peaks[reading_key])} FRET peaks (h={fret_params['height']}, "
+            f"prom={fret_params['prominence']}, dist={fret_params['distance']}, w={fret_params['width']})."
+        )
+        self.status_bar.config(text=summary)
+        messagebox.showinfo("Peak Detection", summary)
+        self._notify_peaks_updated()
 
-        self.rhod_peaks[reading_key] = np.array(rhod_peaks, dtype=int)
-        self.fret_peaks[reading_key] = np.array(fret_peaks, dtype=int)
+    def _store_detected_peaks(self, result):
+        """Write one reading's detection result into the peak dicts."""
+        reading_key = result['reading_key']
+        self._reset_manual_matches(reading_key)
+
+        rhod_peak_properties = result['rhod_props']
+        fret_peak_properties = result['fret_props']
+
+        self.rhod_peaks[reading_key] = result['rhod_peaks']
+        self.fret_peaks[reading_key] = result['fret_peaks']
         self.rhod_peak_properties[reading_key] = rhod_peak_properties
         self.fret_peak_properties[reading_key] = fret_peak_properties
 
@@ -2027,39 +2735,28 @@ class CaMKIIAnalyzer:
                 reading_key,
                 {
                     'Rhod': {
-                        'series': rhod_data,
+                        'series': result['rhod_data'],
                         'peaks': self.rhod_peaks[reading_key],
                         'props': rhod_peak_properties
                     },
                     'FRET': {
-                        'series': fret_data,
+                        'series': result['fret_data'],
                         'peaks': self.fret_peaks[reading_key],
                         'props': fret_peak_properties
                     }
                 }
             )
 
-        rhod_hybrid = self._select_hybrid_boundaries(rhod_data, self.rhod_peaks[reading_key], rhod_peak_properties)
-        for props, (left_base, right_base) in zip(rhod_peak_properties, rhod_hybrid):
+        for props, (left_base, right_base) in zip(rhod_peak_properties, result['rhod_hybrid']):
             props['left_base'] = int(left_base)
             props['right_base'] = int(right_base)
 
-        fret_hybrid = self._select_hybrid_boundaries(fret_data, self.fret_peaks[reading_key], fret_peak_properties)
-        for props, (left_base, right_base) in zip(fret_peak_properties, fret_hybrid):
+        for props, (left_base, right_base) in zip(fret_peak_properties, result['fret_hybrid']):
             props['left_base'] = int(left_base)
             props['right_base'] = int(right_base)
 
-        self.update_plot()
-
-        summary = (
-            f"Detected {len(rhod_peaks)} Rhod peaks (h={rhod_params['height']}, prom={rhod_params['prominence']}, "
-            f"dist={rhod_params['distance']}, w={rhod_params['width']}) and "
-            f"{len(fret_peaks)} FRET peaks (h={fret_params['height']}, prom={fret_params['prominence']}, "
-            f"dist={fret_params['distance']}, w={fret_params['width']})."
-        )
-        self.status_bar.config(text=summary)
-        messagebox.showinfo("Peak Detection", summary)
-        self._notify_peaks_updated()
+        self._invalidate_boundary_segs('Rhod', reading_key)
+        self._invalidate_boundary_segs('FRET', reading_key)
 
     def clear_peaks(self):
         """Clear all detected peaks for the current reading"""
@@ -2076,6 +2773,8 @@ class CaMKIIAnalyzer:
             del self.fret_peak_properties[reading_key]
 
         self._reset_manual_matches(reading_key)
+        self._invalidate_boundary_segs('Rhod', reading_key)
+        self._invalidate_boundary_segs('FRET', reading_key)
 
         self.update_plot()
         self.status_bar.config(text=f"All peaks cleared for Reading {reading}")
@@ -2127,12 +2826,16 @@ class CaMKIIAnalyzer:
         if len(peaks) == 0:
             return
 
-        clicked_idx = int(np.abs(self.time_data - event.xdata).argmin())
+        clicked_idx = self._nearest_time_index(event.xdata)
         tolerance = max(1, int(self._estimate_points_per_minute() * 0.7))
-        distances = np.abs(peaks - clicked_idx)
-        nearest_idx = int(np.argmin(distances))
 
-        if distances[nearest_idx] <= tolerance:
+        # peaks are sorted – only the two neighbours of the insertion point
+        # can be the nearest peak
+        j = int(np.searchsorted(peaks, clicked_idx))
+        candidates = [c for c in (j - 1, j) if 0 <= c < len(peaks)]
+        nearest_idx = min(candidates, key=lambda c: abs(int(peaks[c]) - clicked_idx))
+
+        if abs(int(peaks[nearest_idx]) - clicked_idx) <= tolerance:
             removed_idx = int(peaks[nearest_idx])
             peaks_dict[reading_key] = np.delete(peaks, nearest_idx)
             del props[nearest_idx]
@@ -2140,8 +2843,9 @@ class CaMKIIAnalyzer:
                 peaks_dict.pop(reading_key, None)
                 props_dict.pop(reading_key, None)
             self._clear_manual_match_override(label, reading_key, removed_idx)
+            self._invalidate_boundary_segs(label, reading_key)
             self.status_bar.config(
-                text=f"Removed {label} peak at {self.time_data[clicked_idx]:.2f} min"
+                text=f"Removed {label} peak at {self._time_values()[clicked_idx]:.2f} min"
             )
             self.update_plot()
             self._notify_peaks_updated()
@@ -2164,7 +2868,7 @@ class CaMKIIAnalyzer:
             return
 
         series = data_dict[reading_key]
-        clicked_idx = int(np.abs(self.time_data - event.xdata).argmin())
+        clicked_idx = self._nearest_time_index(event.xdata)
 
         if reading_key not in peaks_dict:
             peaks_dict[reading_key] = np.array([], dtype=int)
@@ -2173,34 +2877,33 @@ class CaMKIIAnalyzer:
         peaks = peaks_dict[reading_key]
         props = props_dict[reading_key]
 
-        if clicked_idx in peaks:
+        # peaks stay sorted, so the insertion point is a binary search away
+        pos = int(np.searchsorted(peaks, clicked_idx))
+        if pos < len(peaks) and peaks[pos] == clicked_idx:
             self.status_bar.config(
-                text=f"{label} peak already exists at {self.time_data[clicked_idx]:.2f} min"
+                text=f"{label} peak already exists at {self._time_values()[clicked_idx]:.2f} min"
             )
             return
 
-        peak_value = float(series.iloc[clicked_idx])
-        left_base = max(0, clicked_idx - 20)
-        right_base = min(len(series) - 1, clicked_idx + 20)
-
-        new_peaks = np.append(peaks, clicked_idx)
-        order = np.argsort(new_peaks)
-        peaks_dict[reading_key] = new_peaks[order].astype(int)
+        # estimate bounds from the local derivative instead of a fixed window
+        peaks_dict[reading_key] = np.insert(peaks, pos, clicked_idx).astype(int)
+        props.insert(pos, self._build_single_peak_property(label, series, clicked_idx))
+        props_dict[reading_key] = props
 
-        new_props = props + [{
-            'peak_idx': clicked_idx,
-            'peak_height': peak_value,
-            'left_base': left_base,
-            'right_base': right_base,
-            'prominence': peak_value - 1.0,
-            'width': 10.0
-        }]
-        props_dict[reading_key] = [new_props[idx] for idx in order]
-
-        self.status_bar.config(text=f"Added {label} peak at {self.time_data[clicked_idx]:.2f} min")
+        self._invalidate_boundary_segs(label, reading_key)
+        self.status_bar.config(text=f"Added {label} peak at {self._time_values()[clicked_idx]:.2f} min")
         self.update_plot()
         self._notify_peaks_updated()
     
+    def _overall_baseline(self, dataset, reading_key, series):
+        """Baseline percentile of a normalized trace, cached per reading."""
+        key = (dataset, reading_key)
+        value = self._baseline_cache.get(key)
+        if value is None:
+            value = float(np.percentile(series, self.baseline_percentile))
+            self._baseline_cache[key] = value
+        return value
+
     def analyze_data(self):
         # Get the current reading from the UI
         reading = int(self.reading_var.get())
@@ -2252,17 +2955,11 @@ class CaMKIIAnalyzer:
         rhod_data = self.rhod_normalized[reading_key] if rhod_available else None
         fret_data = self.fret_normalized[reading_key] if fret_available else None
 
-        rhod_metrics = self._collect_peak_metrics(
-            rhod_data, self.rhod_peak_properties.get(reading_key, [])
-        ) if rhod_available else []
-
-        fret_metrics = self._collect_peak_metrics(
-            fret_data, self.fret_peak_properties.get(reading_key, [])
-        ) if fret_available else []
+        rhod_metrics, fret_metrics, matched_pairs = self._reading_metrics(reading_key)
 
         # Calculate overall statistics
-        rhod_baseline = np.percentile(rhod_data, self.baseline_percentile) if rhod_available else None
-        fret_baseline = np.percentile(fret_data, self.baseline_percentile) if fret_available else None
+        rhod_baseline = self._overall_baseline('Rhod', reading_key, rhod_data) if rhod_available else None
+        fret_baseline = self._overall_baseline('FRET', reading_key, fret_data) if fret_available else None
 
         # Overall summary
         summary_text.insert(tk.END, f"Analysis Results for Reading #{reading}\n\n")
@@ -2272,9 +2969,7 @@ class CaMKIIAnalyzer:
             summary_text.insert(tk.END, f"- Overall baseline: {rhod_baseline:.3f}\n")
             summary_text.insert(tk.END, f"- Max value: {rhod_data.max():.3f}\n")
             if rhod_metrics:
-                avg_rise = np.mean([m['rise_time'] for m in rhod_metrics])
-                avg_decay = np.mean([m['decay_time'] for m in rhod_metrics])
-                avg_auc = np.mean([m['auc'] for m in rhod_metrics])
+                avg_rise, avg_decay, avg_auc = self._metric_means(rhod_metrics)
                 summary_text.insert(tk.END, f"- Average rise time: {avg_rise:.2f} min\n")
                 summary_text.insert(tk.END, f"- Average decay time: {avg_decay:.2f} min\n")
                 summary_text.insert(tk.END, f"- Mean AUC (baseline-subtracted): {avg_auc:.3f}\n")
@@ -2287,23 +2982,21 @@ class CaMKIIAnalyzer:
             summary_text.insert(tk.END, f"- Overall baseline: {fret_baseline:.3f}\n")
             summary_text.insert(tk.END, f"- Max value: {fret_data.max():.3f}\n")
             if fret_metrics:
-                avg_rise = np.mean([m['rise_time'] for m in fret_metrics])
-                avg_decay = np.mean([m['decay_time'] for m in fret_metrics])
-                avg_auc = np.mean([m['auc'] for m in fret_metrics])
+                avg_rise, avg_decay, avg_auc = self._metric_means(fret_metrics)
                 summary_text.insert(tk.END, f"- Average rise time: {avg_rise:.2f} min\n")
                 summary_text.insert(tk.END, f"- Average decay time: {avg_decay:.2f} min\n")
                 summary_text.insert(tk.END, f"- Mean AUC (baseline-subtracted): {avg_auc:.3f}\n")
         else:
             summary_text.insert(tk.END, "- FRET data not loaded\n")
 
-        matched_pairs = self._match_peak_pairs(rhod_metrics, fret_metrics)
         if matched_pairs:
-            delays = [pair['delay'] for pair in matched_pairs]
+            delays = np.fromiter((pair['delay'] for pair in matched_pairs),
+                                 dtype=np.float64, count=len(matched_pairs))
             summary_text.insert(tk.END, f"\nComparative Analysis:\n")
             summary_text.insert(tk.END, f"- Matches: {len(matched_pairs)}\n")
-            summary_text.insert(tk.END, f"- Average Ca ➜ CaMKII delay: {np.mean(delays):.2f} min\n")
-            summary_text.insert(tk.END, f"- Min delay: {np.min(delays):.2f} min\n")
-            summary_text.insert(tk.END, f"- Max delay: {np.max(delays):.2f} min\n")
+            summary_text.insert(tk.END, f"- Average Ca ➜ CaMKII delay: {delays.mean():.2f} min\n")
+            summary_text.insert(tk.END, f"- Min delay: {delays.min():.2f} min\n")
+            summary_text.insert(tk.END, f"- Max delay: {delays.max():.2f} min\n")
 
         auto_match_map = {'Rhod': {}, 'FRET': {}}
         for idx, pair in enumerate(matched_pairs, start=1):
@@ -2313,12 +3006,22 @@ class CaMKIIAnalyzer:
         rhod_match_map = self._resolve_match_map('Rhod', reading_key, rhod_metrics, auto_match_map['Rhod']) if rhod_metrics else {}
         fret_match_map = self._resolve_match_map('FRET', reading_key, fret_metrics, auto_match_map['FRET']) if fret_metrics else {}
 
-        # peak details tab
+        # peak details tab; the trees are only built the first time the tab
+        # is shown, so opening the window just for the summary costs nothing
         peak_details = ttk.Frame(peaks_tab)
         peak_details.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        
-        # create tables for peak details
-        self.create_peak_details_table(peak_details, reading_key, rhod_metrics, fret_metrics)
+
+        details_built = {'done': False}
+
+        def build_details(event=None):
+            if details_built['done']:
+                return
+            if notebook.index(notebook.select()) != notebook.index(peaks_tab):
+                return
+            details_built['done'] = True
+            self.create_peak_details_table(peak_details, reading_key, rhod_metrics, fret_metrics)
+
+        notebook.bind('<<NotebookTabChanged>>', build_details)
 
         button_frame = tk.Frame(analysis_window, bd=0)
         button_frame.pack(side=tk.BOTTOM, fill=tk.X, padx=10, pady=(0, 10))
@@ -2375,67 +3078,72 @@ class CaMKIIAnalyzer:
             **button_opts
         ).pack(side=tk.RIGHT)
     
+    @staticmethod
+    def _metric_means(metrics):
+        """Mean rise time, decay time and AUC for a metrics list in one pass."""
+        arr = np.fromiter(
+            ((m['rise_time'], m['decay_time'], m['auc']) for m in metrics),
+            dtype=np.dtype((np.float64, 3)), count=len(metrics)
+        )
+        return arr.mean(axis=0)
+
+    def _format_metric_rows(self, metrics):
+        """Precompute every table row for a metrics list in one batch."""
+        n = len(metrics)
+        time_values = self._time_values()
+        idx_arr = np.fromiter((m['peak_idx'] for m in metrics), dtype=np.intp, count=n)
+
+        # format each column in one np.char.mod pass instead of seven
+        # f-string calls per row
+        def fmt(key, spec):
+            values = np.fromiter((m[key] for m in metrics), dtype=np.float64, count=n)
+            return np.char.mod(spec, values).tolist()
+
+        return list(zip(
+            (metric['ordinal'] for metric in metrics),
+            np.char.mod('%.2f', time_values[idx_arr]).tolist(),
+            fmt('amplitude', '%.3f'),
+            fmt('width', '%.2f'),
+            fmt('auc', '%.3f'),
+            fmt('rise_time', '%.2f'),
+            fmt('decay_time', '%.2f')
+        ))
+
+    def _build_metrics_tree(self, frame, metrics):
+        columns = ("Peak #", "Position", "Amplitude", "Width", "AUC", "Rise Time", "Decay Time")
+        tree = ttk.Treeview(frame, columns=columns, show="headings")
+
+        for col in columns:
+            tree.heading(col, text=col)
+            tree.column(col, width=100, anchor=tk.CENTER)
+
+        # rows are prepared up front; the insert loop only crosses into Tcl,
+        # and the tree is not packed yet so nothing redraws during population
+        insert = tree.insert
+        for row in self._format_metric_rows(metrics):
+            insert("", "end", values=row)
+
+        scrollbar = ttk.Scrollbar(frame, orient=tk.VERTICAL, command=tree.yview)
+        tree.configure(yscroll=scrollbar.set)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        tree.pack(fill=tk.BOTH, expand=True)
+        return tree
+
     def create_peak_details_table(self, parent, reading_key, rhod_metrics, fret_metrics):
         # create separate frames for Rhod and FRET
         rhod_frame = ttk.LabelFrame(parent, text="Rhod-2 (Calcium) Peaks")
         rhod_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
-        
+
         fret_frame = ttk.LabelFrame(parent, text="FRET (CaMKII) Peaks")
         fret_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
-        
-        # rhod peaks table
+
         if rhod_metrics:
-            columns = ("Peak #", "Position", "Amplitude", "Width", "AUC", "Rise Time", "Decay Time")
-            rhod_tree = ttk.Treeview(rhod_frame, columns=columns, show="headings")
-            
-            for col in columns:
-                rhod_tree.heading(col, text=col)
-                rhod_tree.column(col, width=100, anchor=tk.CENTER)
-
-            for metric in rhod_metrics:
-                peak_time = float(self.time_data.iloc[metric['peak_idx']])
-                rhod_tree.insert("", tk.END, values=(
-                    metric['ordinal'],
-                    f"{peak_time:.2f}",
-                    f"{metric['amplitude']:.3f}",
-                    f"{metric['width']:.2f}",
-                    f"{metric['auc']:.3f}",
-                    f"{metric['rise_time']:.2f}",
-                    f"{metric['decay_time']:.2f}"
-                ))
-            
-            scrollbar = ttk.Scrollbar(rhod_frame, orient=tk.VERTICAL, command=rhod_tree.yview)
-            rhod_tree.configure(yscroll=scrollbar.set)
-            scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-            rhod_tree.pack(fill=tk.BOTH, expand=True)
+            self._build_metrics_tree(rhod_frame, rhod_metrics)
         else:
             ttk.Label(rhod_frame, text="No Rhod peaks detected").pack(pady=20)
-        
-        # fret peaks table
+
         if fret_metrics:
-            columns = ("Peak #", "Position", "Amplitude", "Width", "AUC", "Rise Time", "Decay Time")
-            fret_tree = ttk.Treeview(fret_frame, columns=columns, show="headings")
-            
-            for col in columns:
-                fret_tree.heading(col, text=col)
-                fret_tree.column(col, width=100, anchor=tk.CENTER)
-
-            for metric in fret_metrics:
-                peak_time = float(self.time_data.iloc[metric['peak_idx']])
-                fret_tree.insert("", tk.END, values=(
-                    metric['ordinal'],
-                    f"{peak_time:.2f}",
-                    f"{metric['amplitude']:.3f}",
-                    f"{metric['width']:.2f}",
-                    f"{metric['auc']:.3f}",
-                    f"{metric['rise_time']:.2f}",
-                    f"{metric['decay_time']:.2f}"
-                ))
-            
-            scrollbar = ttk.Scrollbar(fret_frame, orient=tk.VERTICAL, command=fret_tree.yview)
-            fret_tree.configure(yscroll=scrollbar.set)
-            scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-            fret_tree.pack(fill=tk.BOTH, expand=True)
+            self._build_metrics_tree(fret_frame, fret_metrics)
         else:
             ttk.Label(fret_frame, text="No FRET peaks detected").pack(pady=20)
     
@@ -2449,27 +3157,68 @@ class CaMKIIAnalyzer:
                 f.write(analysis_text)
             messagebox.showinfo("Success", f"Analysis saved to {file_path}")
 
+    def _show_toast(self, text, duration_ms=2500):
+        """Non-modal auto-dismissing confirmation.
+
+        Unlike messagebox.showinfo this doesn't block the event loop, so a
+        run of exports isn't gated on dismissing a dialog per file.
+        """
+        toast = tk.Toplevel(self.root)
+        toast.overrideredirect(True)
+        toast.attributes('-topmost', True)
+        tk.Label(toast, text=text, bd=1, relief=tk.SOLID, padx=10, pady=6).pack()
+        toast.update_idletasks()
+        x = self.root.winfo_rootx() + self.root.winfo_width() - toast.winfo_reqwidth() - 20
+        y = self.root.winfo_rooty() + self.root.winfo_height() - toast.winfo_reqheight() - 20
+        toast.geometry(f'+{x}+{y}')
+        toast.after(duration_ms, toast.destroy)
+
+    _EXPORT_FIELDS = (
+        'Dataset', 'Match ID', 'Peak Number', 'Peak Time (min)', 'Peak Signal',
+        'Baseline Level', 'Amplitude (peak-baseline)', 'Width (min)', 'AUC',
+        'Rise Time (min)', 'Decay Time (min)', 'Left Index', 'Right Index'
+    )
+
     def _build_peak_export_rows(self, dataset, metrics, match_map):
-        rows = []
-        for metric in metrics:
-            peak_idx = metric['peak_idx']
-            time_value = float(self.time_data.iloc[peak_idx]) if self.time_data is not None else float('nan')
-            rows.append({
+        if not metrics:
+            return []
+
+        n = len(metrics)
+        idx_arr = np.fromiter((m['peak_idx'] for m in metrics), dtype=np.intp, count=n)
+        time_values = self._time_values()
+        if time_values is not None:
+            times = np.round(time_values[idx_arr], 4)
+        else:
+            times = np.full(n, np.nan)
+
+        def column(key):
+            return np.round(np.fromiter((m[key] for m in metrics), dtype=np.float64, count=n), 6)
+
+        get_match = match_map.get
+        return [
+            {
                 'Dataset': dataset,
-                'Match ID': match_map.get(peak_idx, ''),
+                'Match ID': get_match(peak_idx, ''),
                 'Peak Number': metric['ordinal'],
-                'Peak Time (min)': round(time_value, 4),
-                'Peak Signal': round(float(metric['peak_value']), 6),
-                'Baseline Level': round(float(metric['baseline']), 6),
-                'Amplitude (peak-baseline)': round(float(metric['amplitude']), 6),
-                'Width (min)': round(float(metric['width']), 6),
-                'AUC': round(float(metric['auc']), 6),
-                'Rise Time (min)': round(float(metric['rise_time']), 6),
-                'Decay Time (min)': round(float(metric['decay_time']), 6),
+                'Peak Time (min)': time_value,
+                'Peak Signal': peak_value,
+                'Baseline Level': baseline,
+                'Amplitude (peak-baseline)': amplitude,
+                'Width (min)': width,
+                'AUC': auc,
+                'Rise Time (min)': rise_time,
+                'Decay Time (min)': decay_time,
                 'Left Index': metric['left_idx'],
                 'Right Index': metric['right_idx']
-            })
-        return rows
+            }
+            for metric, peak_idx, time_value, peak_value, baseline, amplitude,
+                width, auc, rise_time, decay_time in zip(
+                    metrics, idx_arr.tolist(), times.tolist(),
+                    column('peak_value').tolist(), column('baseline').tolist(),
+                    column('amplitude').tolist(), column('width').tolist(),
+                    column('auc').tolist(), column('rise_time').tolist(),
+                    column('decay_time').tolist())
+        ]
 
     def _export_peak_metrics(self, dataset, reading_number, metrics, match_map):
         if not metrics:
@@ -2477,7 +3226,6 @@ class CaMKIIAnalyzer:
             return
 
         rows = self._build_peak_export_rows(dataset, metrics, match_map)
-        df = pd.DataFrame(rows)
 
         default_name = f"{dataset.lower()}_peaks_reading_{reading_number}.csv"
         file_path = filedialog.asksaveasfilename(
@@ -2490,7 +3238,12 @@ class CaMKIIAnalyzer:
             return
 
         try:
-            df.to_csv(file_path, index=False)
+            # the rows are already plain rounded Python values, so the stdlib
+            # writer is enough; no need to build a DataFrame just to serialize
+            with open(file_path, 'w', newline='') as handle:
+                writer = csv.DictWriter(handle, fieldnames=self._EXPORT_FIELDS)
+                writer.writeheader()
+                writer.writerows(rows)
         except Exception as exc:
             messagebox.showerror(
                 "Export Peaks",
@@ -2498,23 +3251,13 @@ class CaMKIIAnalyzer:
             )
             return
 
-        messagebox.showinfo(
-            "Export Peaks",
-            f"Saved {dataset} peak table to {file_path}"
-        )
+        self._show_toast(f"Saved {dataset} peak table to {file_path}")
 
     def _export_all_peak_metrics(self, reading_number, dataset_payload):
-        rows = []
-        for dataset, (metrics, match_map) in dataset_payload.items():
-            if metrics:
-                rows.extend(self._build_peak_export_rows(dataset, metrics, match_map))
-
-        if not rows:
+        if not any(metrics for metrics, _ in dataset_payload.values()):
             messagebox.showinfo("Export Peaks", "No peaks available to export.")
             return
 
-        df = pd.DataFrame(rows)
-
         default_name = f"rhod_fret_peaks_reading_{reading_number}.csv"
         file_path = filedialog.asksaveasfilename(
             defaultextension='.csv',
@@ -2526,7 +3269,14 @@ class CaMKIIAnalyzer:
             return
 
         try:
-            df.to_csv(file_path, index=False)
+            # write one dataset at a time instead of accumulating a combined
+            # row list first
+            with open(file_path, 'w', newline='') as handle:
+                writer = csv.DictWriter(handle, fieldnames=self._EXPORT_FIELDS)
+                writer.writeheader()
+                for dataset, (metrics, match_map) in dataset_payload.items():
+                    if metrics:
+                        writer.writerows(self._build_peak_export_rows(dataset, metrics, match_map))
         except Exception as exc:
             messagebox.showerror(
                 "Export Peaks",
@@ -2534,219 +3284,236 @@ class CaMKIIAnalyzer:
             )
             return
 
-        messagebox.showinfo(
-            "Export Peaks",
-            f"Saved Rhod and FRET peak tables to {file_path}"
-        )
+        self._show_toast(f"Saved Rhod and FRET peak tables to {file_path}")
 
     #TODO: make this whole thing work to adjust peak boundaries manually
     def adjust_peak_boundaries(self):
         reading = int(self.reading_var.get())
         reading_key = f'#{reading}'
-        
+
         # Check if we have peaks detected
-        if (reading_key not in self.rhod_peaks or len(self.rhod_peaks[reading_key]) == 0) and \
-           (reading_key not in self.fret_peaks or len(self.fret_peaks[reading_key]) == 0):
+        if len(self.fret_peaks.get(reading_key, ())) == 0 and \
+           len(self.rhod_peaks.get(reading_key, ())) == 0:
             messagebox.showwarning("No Peaks", "Please detect peaks first")
             return
-        
-        # Create a new window for peak boundary adjustment
-        adjustment_window = tk.Toplevel(self.root)
-        adjustment_window.title(f"Adjust Peak Boundaries - Reading #{reading}")
-        adjustment_window.geometry("600x400")
-        
+
+        # reuse the dialog shell across invocations; only the tab contents
+        # depend on the reading, so repeat opens rebuild O(peaks) widgets
+        window = getattr(self, '_adj_window', None)
+        if window is not None and window.winfo_exists():
+            window.title(f"Adjust Peak Boundaries - Reading #{reading}")
+            self._refresh_adj_tabs(reading_key)
+            window.deiconify()
+            window.lift()
+            return
+
+        self._adj_window = tk.Toplevel(self.root)
+        self._adj_window.title(f"Adjust Peak Boundaries - Reading #{reading}")
+        self._adj_window.geometry("600x400")
+
         # Create notebook with tabs for FRET and Rhod
-        notebook = ttk.Notebook(adjustment_window)
-        fret_tab = ttk.Frame(notebook)
-        rhod_tab = ttk.Frame(notebook)
-        notebook.add(fret_tab, text="FRET Peaks")
-        notebook.add(rhod_tab, text="Rhod Peaks")
+        notebook = ttk.Notebook(self._adj_window)
+        self._adj_fret_tab = ttk.Frame(notebook)
+        self._adj_rhod_tab = ttk.Frame(notebook)
+        notebook.add(self._adj_fret_tab, text="FRET Peaks")
+        notebook.add(self._adj_rhod_tab, text="Rhod Peaks")
         notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        
-        # FRET peaks adjustment controls
-        if reading_key in self.fret_peaks and len(self.fret_peaks[reading_key]) > 0:
-            # Peak selector
-            ttk.Label(fret_tab, text="Select Peak:").grid(row=0, column=0, padx=5, pady=5)
-            fret_peak_var = tk.IntVar(value=1)
-            fret_peak_combo = ttk.Combobox(
-                fret_tab,
-                textvariable=fret_peak_var,
-                values=[str(i+1) for i in range(len(self.fret_peaks[reading_key]))],
-                state="readonly",
-                width=5
-            )
-            fret_peak_combo.grid(row=0, column=1, padx=5, pady=5)
-            
-            # Boundary adjustment sliders
-            ttk.Label(fret_tab, text="Left Boundary:").grid(row=1, column=0, padx=5, pady=5, sticky="w")
-            fret_left_var = tk.IntVar(value=0)
-            fret_left_slider = ttk.Scale(
-                fret_tab,
-                from_=0,
-                to=len(self.time_data)-1,
-                orient=tk.HORIZONTAL,
-                length=200,
-                variable=fret_left_var
-            )
-            fret_left_slider.grid(row=1, column=1, padx=5, pady=5)
-            
-            ttk.Label(fret_tab, text="Right Boundary:").grid(row=2, column=0, padx=5, pady=5, sticky="w")
-            fret_right_var = tk.IntVar(value=100)
-            fret_right_slider = ttk.Scale(
-                fret_tab,
-                from_=0,
-                to=len(self.time_data)-1,
-                orient=tk.HORIZONTAL,
-                length=200,
-                variable=fret_right_var
-            )
-            fret_right_slider.grid(row=2, column=1, padx=5, pady=5)
-            
-            # Update button
-            ttk.Button(
-                fret_tab,
-                text="Update Boundaries",
-                command=lambda: self.update_boundaries("fret", int(fret_peak_var.get())-1, fret_left_var.get(), fret_right_var.get())
-            ).grid(row=3, column=0, columnspan=2, pady=10)
-            
-            # Function to update sliders when peak selection changes
-            def update_fret_sliders(*args):
-                peak_idx = int(fret_peak_var.get()) - 1
-                if 0 <= peak_idx < len(self.fret_peak_properties[reading_key]):
-                    props = self.fret_peak_properties[reading_key][peak_idx]
-                    fret_left_var.set(props['left_base'])
-                    fret_right_var.set(props['right_base'])
-            
-            fret_peak_combo.bind("<<ComboboxSelected>>", update_fret_sliders)
-            update_fret_sliders()  # Initialize with first peak
-        else:
-            ttk.Label(fret_tab, text="No FRET peaks detected").pack(pady=20)
-        
-        # Rhod peaks adjustment controls
-        if reading_key in self.rhod_peaks and len(self.rhod_peaks[reading_key]) > 0:
-            # Peak selector
-            ttk.Label(rhod_tab, text="Select Peak:").grid(row=0, column=0, padx=5, pady=5)
-            rhod_peak_var = tk.IntVar(value=1)
-            rhod_peak_combo = ttk.Combobox(
-                rhod_tab,
-                textvariable=rhod_peak_var,
-                values=[str(i+1) for i in range(len(self.rhod_peaks[reading_key]))],
-                state="readonly",
-                width=5
-            )
-            rhod_peak_combo.grid(row=0, column=1, padx=5, pady=5)
-            
-            # Boundary adjustment sliders
-            ttk.Label(rhod_tab, text="Left Boundary:").grid(row=1, column=0, padx=5, pady=5, sticky="w")
-            rhod_left_var = tk.IntVar(value=0)
-            rhod_left_slider = ttk.Scale(
-                rhod_tab,
-                from_=0,
-                to=len(self.time_data)-1,
-                orient=tk.HORIZONTAL,
-                length=200,
-                variable=rhod_left_var
-            )
-            rhod_left_slider.grid(row=1, column=1, padx=5, pady=5)
-            
-            ttk.Label(rhod_tab, text="Right Boundary:").grid(row=2, column=0, padx=5, pady=5, sticky="w")
-            rhod_right_var = tk.IntVar(value=100)
-            rhod_right_slider = ttk.Scale(
-                rhod_tab,
-                from_=0,
-                to=len(self.time_data)-1,
-                orient=tk.HORIZONTAL,
-                length=200,
-                variable=rhod_right_var
-            )
-            rhod_right_slider.grid(row=2, column=1, padx=5, pady=5)
-            
-            # Update button
-            ttk.Button(
-                rhod_tab,
-                text="Update Boundaries",
-                command=lambda: self.update_boundaries("rhod", int(rhod_peak_var.get())-1, rhod_left_var.get(), rhod_right_var.get())
-            ).grid(row=3, column=0, columnspan=2, pady=10)
-            
-            # Function to update sliders when peak selection changes
-            def update_rhod_sliders(*args):
-                peak_idx = int(rhod_peak_var.get()) - 1
-                if 0 <= peak_idx < len(self.rhod_peak_properties[reading_key]):
-                    props = self.rhod_peak_properties[reading_key][peak_idx]
-                    rhod_left_var.set(props['left_base'])
-                    rhod_right_var.set(props['right_base'])
-            
-            rhod_peak_combo.bind("<<ComboboxSelected>>", update_rhod_sliders)
-            update_rhod_sliders()  # Initialize with first peak
-        else:
-            ttk.Label(rhod_tab, text="No Rhod peaks detected").pack(pady=20)
 
+        self._refresh_adj_tabs(reading_key)
 
-        # Close button
+        # Close button hides the shell so the next open can reuse it
         ttk.Button(
-            adjustment_window,
+            self._adj_window,
             text="Done",
-            command=adjustment_window.destroy
+            command=self._adj_window.withdraw
         ).pack(pady=10)
+
+    def _refresh_adj_tabs(self, reading_key):
+        """(Re)build the per-reading contents of the adjustment dialog."""
+        # resolve the per-reading structures once; every widget and callback
+        # below closes over these locals instead of re-hashing the dicts
+        fret_peaks = self.fret_peaks.get(reading_key)
+        rhod_peaks = self.rhod_peaks.get(reading_key)
+        fret_props = self.fret_peak_properties.get(reading_key, [])
+        rhod_props = self.rhod_peak_properties.get(reading_key, [])
+        n_time = len(self.time_data) - 1 if self.time_data is not None else 0
+        n_fret = len(fret_peaks) if fret_peaks is not None else 0
+        n_rhod = len(rhod_peaks) if rhod_peaks is not None else 0
+
+        for tab in (self._adj_fret_tab, self._adj_rhod_tab):
+            for child in tab.winfo_children():
+                child.destroy()
+
+        # one shared builder for both tabs – the blocks were identical apart
+        # from the dataset tag and which props list the callbacks read
+        if n_fret > 0:
+            self._build_peak_tab(self._adj_fret_tab, "fret",
+                                 tuple(map(str, range(1, n_fret + 1))), fret_props, n_time)
+        else:
+            ttk.Label(self._adj_fret_tab, text="No FRET peaks detected").pack(pady=20)
+
+        if n_rhod > 0:
+            self._build_peak_tab(self._adj_rhod_tab, "rhod",
+                                 tuple(map(str, range(1, n_rhod + 1))), rhod_props, n_time)
+        else:
+            ttk.Label(self._adj_rhod_tab, text="No Rhod peaks detected").pack(pady=20)
     
+    def _build_peak_tab(self, tab, data_type, peak_values, props, n_time):
+        """Build one boundary-adjustment tab (shared by FRET and Rhod)."""
+        # current selection/bounds mirrored in plain Python ints so the drag
+        # callbacks never round-trip through Tcl via IntVar.get()
+        current = {'peak': 0, 'left': 0, 'right': min(100, n_time)}
+
+        # Peak selector
+        ttk.Label(tab, text="Select Peak:").grid(row=0, column=0, padx=5, pady=5)
+        peak_var = tk.IntVar(value=1)
+        peak_combo = ttk.Combobox(
+            tab,
+            textvariable=peak_var,
+            values=peak_values,
+            state="readonly",
+            width=5
+        )
+        peak_combo.grid(row=0, column=1, padx=5, pady=5)
+
+        def on_drag(which, value):
+            # live-apply while dragging; the replot itself is debounced
+            current[which] = int(float(value))
+            self.update_boundaries(data_type, current['peak'],
+                                   current['left'], current['right'])
+
+        # Boundary adjustment sliders
+        ttk.Label(tab, text="Left Boundary:").grid(row=1, column=0, padx=5, pady=5, sticky="w")
+        left_var = tk.IntVar(value=0)
+        left_slider = ttk.Scale(
+            tab,
+            from_=0,
+            to=n_time,
+            orient=tk.HORIZONTAL,
+            length=200,
+            variable=left_var,
+            command=lambda v: on_drag('left', v)
+        )
+        left_slider.grid(row=1, column=1, padx=5, pady=5)
+
+        ttk.Label(tab, text="Right Boundary:").grid(row=2, column=0, padx=5, pady=5, sticky="w")
+        right_var = tk.IntVar(value=100)
+        right_slider = ttk.Scale(
+            tab,
+            from_=0,
+            to=n_time,
+            orient=tk.HORIZONTAL,
+            length=200,
+            variable=right_var,
+            command=lambda v: on_drag('right', v)
+        )
+        right_slider.grid(row=2, column=1, padx=5, pady=5)
+
+        # Update button (kept for explicit confirmation; reads the mirror)
+        ttk.Button(
+            tab,
+            text="Update Boundaries",
+            command=lambda: self.update_boundaries(data_type, current['peak'],
+                                                   current['left'], current['right'])
+        ).grid(row=3, column=0, columnspan=2, pady=10)
+
+        # Function to update sliders when peak selection changes
+        def update_sliders(*args):
+            peak_idx = int(peak_var.get()) - 1
+            if 0 <= peak_idx < len(props):
+                current['peak'] = peak_idx
+                current['left'] = int(props[peak_idx]['left_base'])
+                current['right'] = int(props[peak_idx]['right_base'])
+                left_var.set(current['left'])
+                right_var.set(current['right'])
+
+        peak_combo.bind("<<ComboboxSelected>>", update_sliders)
+        update_sliders()  # Initialize with first peak
+
     def update_boundaries(self, data_type, peak_idx, left_idx, right_idx):
         reading = int(self.reading_var.get())
         reading_key = f'#{reading}'
-        
-        # Validate indices
-        if left_idx >= right_idx:
-            messagebox.showerror("Error", "Left boundary must be less than right boundary")
-            return
-        
+
+        # normalize rather than reject: swap an inverted pair and keep the
+        # window at least one sample wide, so live drags never hit a dialog
+        left_idx, right_idx = sorted((int(left_idx), int(right_idx)))
+        if self.time_data is not None:
+            last = len(self.time_data) - 1
+            left_idx = max(0, min(left_idx, last - 1))
+            right_idx = min(right_idx, last)
+        right_idx = max(right_idx, left_idx + 1)
+
         # Update appropriate peak properties
         if data_type == "fret" and reading_key in self.fret_peak_properties:
             if 0 <= peak_idx < len(self.fret_peak_properties[reading_key]):
                 self.fret_peak_properties[reading_key][peak_idx]['left_base'] = left_idx
                 self.fret_peak_properties[reading_key][peak_idx]['right_base'] = right_idx
-                self.update_plot()
-                messagebox.showinfo("Success", f"Updated boundaries for FRET peak #{peak_idx+1}")
-        
+                self._peaks_version += 1
+                self._invalidate_boundary_segs('FRET', reading_key)
+                self._request_replot()
+                self.status_bar.config(text=f"Updated boundaries for FRET peak #{peak_idx+1}")
+
         elif data_type == "rhod" and reading_key in self.rhod_peak_properties:
             if 0 <= peak_idx < len(self.rhod_peak_properties[reading_key]):
                 self.rhod_peak_properties[reading_key][peak_idx]['left_base'] = left_idx
                 self.rhod_peak_properties[reading_key][peak_idx]['right_base'] = right_idx
-                self.update_plot()
-                messagebox.showinfo("Success", f"Updated boundaries for Rhod peak #{peak_idx+1}")
-
-def generate_boundary_diagnostics_cli(
-    rhod_path='rhod.xlsx',
-    fret_path='fret.xlsx',
-    reading=1,
-    output_dir='boundary_diagnostics',
-    rhod_params=None,
-    fret_params=None
-):
-    """Run boundary diagnostics without launching the Tk UI."""
+                self._peaks_version += 1
+                self._invalidate_boundary_segs('Rhod', reading_key)
+                self._request_replot()
+                self.status_bar.config(text=f"Updated boundaries for Rhod peak #{peak_idx+1}")
+
+    def _request_replot(self):
+        """Coalesce rapid boundary edits into one update_plot per ~50 ms."""
+        if self._replot_after_id is None:
+            self._replot_after_id = self.root.after(50, self._flush_replot)
+
+    def _flush_replot(self):
+        self._replot_after_id = None
+        self.update_plot()
 
+def _build_cli_analyzer(rhod_path, fret_path, output_dir):
+    """Set up a Tk-less analyzer with both raw files loaded and normalized."""
     analyzer = CaMKIIAnalyzer.__new__(CaMKIIAnalyzer)
 
-    analyzer.rhod_data = pd.read_excel(rhod_path, sheet_name='Raw Data')
-    analyzer.fret_data = pd.read_excel(fret_path, sheet_name='Raw Data')
+    # same loader as the UI: calamine engine, reading-column filter and a
+    # Parquet sidecar so repeat CLI runs skip the Excel parse entirely
+    analyzer.rhod_data = analyzer._read_rawdata(rhod_path)
+    analyzer.fret_data = analyzer._read_rawdata(fret_path)
 
     time_series = analyzer.rhod_data['Time [ms]'].astype(float) / 60000.0
     analyzer.time_data = time_series.reset_index(drop=True)
 
     analyzer.rhod_normalized = {}
     analyzer.fret_normalized = {}
+    analyzer._time_arr = analyzer.time_data.to_numpy(dtype=np.float64)
+    analyzer._rhod_arr = {}
+    analyzer._fret_arr = {}
+    analyzer._pts_per_min = None
+    analyzer._boundary_segs = {'Rhod': {}, 'FRET': {}}
+    analyzer._baseline_cache = {}
+    analyzer._edit_cache = None
     analyzer.manual_match_overrides = {'Rhod': {}, 'FRET': {}}
     analyzer.rhod_peaks = {}
     analyzer.fret_peaks = {}
     analyzer.rhod_peak_properties = {}
     analyzer.fret_peak_properties = {}
     analyzer._table_item_lookup = {'Rhod': {}, 'FRET': {}}
+    analyzer._table_signature = {'Rhod': None, 'FRET': None}
     analyzer._hovered_peak = {'Rhod': None, 'FRET': None}
     analyzer._table_edit_entry = None
     analyzer._table_edit_meta = None
     analyzer._boundary_diag_dir = os.path.abspath(output_dir)
     analyzer.boundary_diagnostics_enabled = True
+    analyzer._boundary_diag_figures_enabled = True
 
     analyzer.normalize_rhod_data()
     analyzer.normalize_fret_data()
+    return analyzer
+
+
+def _run_cli_reading(analyzer, reading, rhod_params, fret_params):
+    """Detect peaks and emit boundary diagnostics for one reading."""
+    from scipy import signal
 
     if rhod_params is None:
         rhod_params = {'height': 1.05, 'prominence': 0.05, 'distance': 10, 'width': 3}
@@ -2776,27 +3543,8 @@ def generate_boundary_diagnostics_cli(
         width=fret_params['width']
     )
 
-    rhod_peak_properties = []
-    for i in range(len(rhod_peaks)):
-        rhod_peak_properties.append({
-            'peak_idx': int(rhod_peaks[i]),
-            'left_base': int(rhod_props['left_bases'][i]),
-            'right_base': int(rhod_props['right_bases'][i]),
-            'peak_height': float(rhod_props['peak_heights'][i]),
-            'prominence': float(rhod_props['prominences'][i]),
-            'width': float(rhod_props['widths'][i])
-        })
-
-    fret_peak_properties = []
-    for i in range(len(fret_peaks)):
-        fret_peak_properties.append({
-            'peak_idx': int(fret_peaks[i]),
-            'left_base': int(fret_props['left_bases'][i]),
-            'right_base': int(fret_props['right_bases'][i]),
-            'peak_height': float(fret_props['peak_heights'][i]),
-            'prominence': float(fret_props['prominences'][i]),
-            'width': float(fret_props['widths'][i])
-        })
+    rhod_peak_properties = CaMKIIAnalyzer._props_from_find_peaks(rhod_peaks, rhod_props)
+    fret_peak_properties = CaMKIIAnalyzer._props_from_find_peaks(fret_peaks, fret_props)
 
     analyzer._run_boundary_diagnostics(
         reading_key,
@@ -2814,6 +3562,47 @@ def generate_boundary_diagnostics_cli(
         }
     )
 
+
+def generate_boundary_diagnostics_cli(
+    rhod_path='rhod.xlsx',
+    fret_path='fret.xlsx',
+    reading=1,
+    output_dir='boundary_diagnostics',
+    rhod_params=None,
+    fret_params=None
+):
+    """Run boundary diagnostics for one reading without launching the Tk UI."""
+    analyzer = _build_cli_analyzer(rhod_path, fret_path, output_dir)
+    _run_cli_reading(analyzer, reading, rhod_params, fret_params)
+    return os.path.abspath(analyzer._boundary_diag_dir)
+
+
+def generate_boundary_diagnostics_cli_batch(
+    rhod_path='rhod.xlsx',
+    fret_path='fret.xlsx',
+    readings=None,
+    output_dir='boundary_diagnostics',
+    rhod_params=None,
+    fret_params=None
+):
+    """Run boundary diagnostics for many readings with a single Excel load.
+
+    Readings default to every one present in both datasets. The loop is
+    sequential on purpose: the diagnostics renderer reuses one figure, and
+    after the shared Parquet sidecar the per-reading cost is dominated by
+    find_peaks, which is already C code.
+    """
+    analyzer = _build_cli_analyzer(rhod_path, fret_path, output_dir)
+
+    if readings is None:
+        readings = sorted(
+            (int(key[1:]) for key in analyzer.rhod_normalized
+             if key in analyzer.fret_normalized)
+        )
+
+    for reading in readings:
+        _run_cli_reading(analyzer, reading, rhod_params, fret_params)
+
     return os.path.abspath(analyzer._boundary_diag_dir)
 
 # Create and run the application